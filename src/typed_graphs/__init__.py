@@ -0,0 +1,23 @@
+'''
+Type annotated graphs
+
+Submodules are imported on first attribute access, e.g. typed_graphs.graph_reverse,
+so importing the package doesn't load what only some of them need
+(asyncio for graph_async, multiprocessing for graph_parallel)
+'''
+from typing import Any
+import importlib
+
+__all__ = [
+    'algorithms', 'degree_index', 'dictgraph', 'dictgraph_interned', 'dictgraph_nodeclass',
+    'dictgraph_nodegeneric', 'dictgraph_reverse_nodegeneric', 'graph', 'graph_async',
+    'graph_cache', 'graph_functions', 'graph_generic', 'graph_multi', 'graph_parallel',
+    'graph_reverse', 'graph_sharded', 'graph_undirected', 'igraph', 'ordered_set', 'reachability',
+    'setgraph_nodeclass', 'subgraph_matching', 'triangles',
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
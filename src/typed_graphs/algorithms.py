@@ -0,0 +1,157 @@
+# module: algorithms.py
+'''
+Algorithms written once against a minimal protocol:
+* nodes(g) iterates over the nodes of g
+* neighbors(g) returns a function that maps a node to an iterable of its successors
+
+Both dispatch on the type of g, and every representation in this package gets
+an accessor that reads its adjacency storage directly instead of going through
+INode.__iter__, so the algorithms run at the speed of a plain dict of sets:
+graphs whose nodes keep their successors in node._adj are recognized by that
+attribute, and mappings from nodes to successors by being a Mapping, so this
+module doesn't import the representations it serves
+Other representations can register their own with nodes.register / neighbors.register,
+or pass a successors function explicitly
+'''
+from typing import (
+    Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple,
+    TypeVar
+)
+from collections import deque
+import collections.abc
+from functools import singledispatch
+from operator import attrgetter
+from .graph import Graph
+from . import graph_generic
+
+N = TypeVar('N', bound=Hashable)
+Neighbors = Callable[[N], Iterable[N]]
+
+_adj = attrgetter('_adj')
+
+
+@singledispatch
+def nodes(g: Any) -> Iterable[Any]:
+    return g  # type: ignore
+
+
+@nodes.register(graph_generic.Graph)
+def _nodes_graph_generic(g: graph_generic.Graph[Any]) -> Iterable[Any]:
+    return g.nodes
+
+
+@singledispatch
+def neighbors(g: Any) -> Neighbors[Any]:
+    '''
+    Fallback for any IGraph: nodes are collections of their neighbors
+    If they keep them in node._adj (graph_multi, graph_sharded, setgraph_nodeclass),
+    that is read directly; the first node is assumed to be like the others
+    '''
+    for node in g:
+        if hasattr(node, '_adj'):
+            return _adj
+        break
+    return iter
+
+
+@neighbors.register(Graph)
+@neighbors.register(graph_generic.Graph)
+def _neighbors_adj(g: Any) -> Neighbors[Any]:
+    return _adj
+
+
+# dictgraph, dictgraph_nodegeneric, dictgraph_nodeclass, dictgraph_interned
+# dictgraph_reverse_nodegeneric and InternedReverseGraph map nodes to an Adjacency,
+# whose successors are in .forward
+@neighbors.register(dict)
+@neighbors.register(collections.abc.Mapping)
+def _neighbors_mapping(g: Mapping[Any, Any]) -> Neighbors[Any]:
+    first = next(iter(g.values()), None)
+    if hasattr(first, 'forward'):
+        return lambda node: g[node].forward
+    return g.__getitem__
+
+
+def bfs(g: Any, source: N, successors: Optional[Neighbors[N]] = None) -> Dict[N, int]:
+    '''
+    Returns the distance from source to every node reachable from it
+    '''
+    successors = successors or neighbors(g)
+    dist = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        next_dist = dist[node] + 1
+        for neighbor in successors(node):
+            if neighbor not in dist:
+                dist[neighbor] = next_dist
+                queue.append(neighbor)
+    return dist
+
+
+def reachable(g: Any, source: N, successors: Optional[Neighbors[N]] = None) -> Set[N]:
+    successors = successors or neighbors(g)
+    seen = {source}
+    stack = [source]
+    while stack:
+        for neighbor in successors(stack.pop()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def topological_sort(g: Any, successors: Optional[Neighbors[Any]] = None) -> List[Any]:
+    '''
+    Returns the nodes so that every edge goes from an earlier node to a later one
+    Raises ValueError if the graph has a cycle
+    '''
+    successors = successors or neighbors(g)
+    in_degree = {node: 0 for node in nodes(g)}
+    for node in in_degree:
+        for neighbor in successors(node):
+            in_degree[neighbor] += 1
+    order = [node for node, degree in in_degree.items() if degree == 0]
+    for node in order:  # order grows while we iterate over it
+        for neighbor in successors(node):
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                order.append(neighbor)
+    if len(order) != len(in_degree):
+        raise ValueError('Graph has a cycle')
+    return order
+
+
+def benchmark(n: int = 100000, m: int = 1000000, repeat: int = 3) -> None:
+    '''
+    Times bfs on the same random graph stored as a dictgraph (dict of int sets)
+    and as a graph.Graph, through its registered accessor and through the INode protocol
+    '''
+    import random
+    import time
+
+    rng = random.Random(0)
+    int_graph: Dict[int, Set[int]] = {i: set() for i in range(n)}
+    g = Graph()
+    node_list = [g.add_node(i) for i in range(n)]
+    for _ in range(m):
+        tail, head = rng.randrange(n), rng.randrange(n)
+        int_graph[tail].add(head)
+        node_list[tail]._adj.add(node_list[head])
+
+    cases: List[Tuple[str, Any, Any, Optional[Neighbors[Any]]]] = [
+        ('dict of int sets', int_graph, 0, None),
+        ('Graph, specialized', g, node_list[0], None),
+        ('Graph, INode protocol', g, node_list[0], iter),
+    ]
+    for name, graph, source, accessor in cases:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            bfs(graph, source, accessor)
+            best = min(best, time.perf_counter() - start)
+        print('{:>22}: {:.3f}s'.format(name, best))
+
+
+if __name__ == '__main__':
+    benchmark()
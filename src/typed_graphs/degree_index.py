@@ -0,0 +1,113 @@
+# module: degree_index.py
+from typing import Dict, Generic, Hashable, List, Set, TypeVar
+from itertools import islice
+
+T = TypeVar('T', bound=Hashable)
+
+
+class DegreeIndex(Generic[T]):
+    '''
+    Nodes bucketed by degree
+
+    Adding or removing a node and changing its degree by one are O(1)
+    max_degree / min_degree are amortized O(1); top and histogram only look
+    at the distinct degrees present, never at every node
+    '''
+
+    _degree: Dict[T, int]
+    _buckets: Dict[int, Set[T]]
+
+    def __init__(self) -> None:
+        self._degree = {}
+        self._buckets = {}
+        # bounds on the largest and the smallest degree present,
+        # tightened lazily by max_degree / min_degree
+        self._max = 0
+        self._min = 0
+
+    def __len__(self) -> int:
+        return len(self._degree)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._degree
+
+    def degree(self, node: T) -> int:
+        return self._degree[node]
+
+    def add(self, node: T, degree: int = 0) -> None:
+        if node in self._degree:
+            raise KeyError('{} is already indexed'.format(node))
+        if not self._degree:
+            self._max = self._min = degree
+        self._insert(node, degree)
+
+    def remove(self, node: T) -> None:
+        self._discard(node, self._degree.pop(node))
+
+    def increment(self, node: T) -> None:
+        degree = self._degree[node]
+        self._discard(node, degree)
+        self._insert(node, degree + 1)
+
+    def decrement(self, node: T) -> None:
+        degree = self._degree[node]
+        self._discard(node, degree)
+        self._insert(node, degree - 1)
+
+    def _insert(self, node: T, degree: int) -> None:
+        self._degree[node] = degree
+        bucket = self._buckets.get(degree)
+        if bucket is None:
+            bucket = self._buckets[degree] = set()
+        bucket.add(node)
+        if degree > self._max:
+            self._max = degree
+        if degree < self._min:
+            self._min = degree
+
+    def _discard(self, node: T, degree: int) -> None:
+        bucket = self._buckets[degree]
+        bucket.remove(node)
+        if not bucket:
+            del self._buckets[degree]
+
+    def max_degree(self) -> int:
+        '''
+        Raises ValueError if there are no nodes
+        '''
+        if not self._buckets:
+            raise ValueError('max_degree() of an empty index')
+        while self._max not in self._buckets:
+            self._max -= 1
+        return self._max
+
+    def min_degree(self) -> int:
+        '''
+        Raises ValueError if there are no nodes
+        '''
+        if not self._buckets:
+            raise ValueError('min_degree() of an empty index')
+        while self._min not in self._buckets:
+            self._min += 1
+        return self._min
+
+    def top(self, k: int) -> List[T]:
+        '''
+        Returns k nodes with the highest degree (fewer if there aren't enough nodes),
+        highest first; ties are broken arbitrarily
+        '''
+        result: List[T] = []
+        for degree in sorted(self._buckets, reverse=True):
+            if len(result) >= k:
+                break
+            result.extend(islice(self._buckets[degree], k - len(result)))
+        return result
+
+    def nodes_with_degree(self, degree: int) -> Set[T]:
+        return set(self._buckets.get(degree, ()))
+
+    def histogram(self) -> Dict[int, int]:
+        '''
+        Maps each degree present to the number of nodes with that degree, in increasing order
+        '''
+        return {degree: len(self._buckets[degree]) for degree in sorted(self._buckets)}
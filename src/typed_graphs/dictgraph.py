@@ -39,14 +39,3 @@ def write_graph(g: Graph) -> str:
         output.extend([' ' + str(neighbor) for neighbor in neighbors])
         output.append('\n')
     return ''.join(output)
-
-
-def test_serialization() -> None:
-    graph: Graph = {0: {0, 1, 2}, 1: set(), 2: {1}, 3: set()}
-    g_str = '''0 0 1 2
-    1
-    2 1
-    3'''
-
-    assert read_graph(g_str) == graph
-    assert read_graph(write_graph(graph)) == graph
@@ -0,0 +1,278 @@
+from typing import (
+    AbstractSet, Any, Callable, ClassVar, Dict, Generic, Iterator, List, Mapping, Optional,
+    Set, Tuple, Type, TypeVar
+)
+from . import dictgraph_nodegeneric
+from .graph_functions import gc_paused
+
+Node = TypeVar('Node')
+G = TypeVar('G', bound='InternedGraph[Any]')
+
+
+class Neighbors(AbstractSet[Node]):
+    '''
+    Read-only view of a set of node ids, presented as a set of node labels
+    '''
+    __slots__ = ('_graph', '_label_ids', '_ids')
+
+    def __init__(self, graph: 'InternedGraph[Node]', ids: Set[int]) -> None:
+        self._graph = graph
+        # graph._ids, one attribute lookup closer for __contains__
+        self._label_ids = graph._ids
+        self._ids = ids
+
+    def __contains__(self, label: object) -> bool:
+        # None (an unknown label) is never in the set
+        return self._label_ids.get(label) in self._ids  # type: ignore
+
+    def __iter__(self) -> Iterator[Node]:
+        return map(self._graph._labels.__getitem__, self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class InternedGraph(Mapping[Node, AbstractSet[Node]]):
+    '''
+    Same interface as dictgraph_nodegeneric.Graph (a read-only one: use add_edge
+    and remove_edge to change it), but every label is stored once and mapped to
+    a dense int id; adjacency sets hold ids, and labels only appear at the API boundary
+
+    As in dictgraph_nodegeneric, the keys are the labels added with add_node or as
+    the tail of an edge; a label that only appears as a neighbor is interned, but is
+    not a key. Subclasses set neighbors_are_nodes to make every label a key
+
+    This trades lookup time for memory: labels are hashed once per graph instead of
+    once per set they're in, but every lookup translates labels to ids first, and
+    g[tail] returns a view whose __contains__ is a python method
+    So `head in g[tail]` and has_edge take 3 hash lookups (tail, head and the id
+    in the set) plus a python call, against 2 C-level lookups for a dict of sets;
+    expect them to be about 2x and 1.5x slower (see benchmark)
+    The view of each key is created once and kept, so g[tail] doesn't allocate
+    '''
+
+    neighbors_are_nodes: ClassVar[bool] = False
+
+    _ids: Dict[Node, int]
+    _labels: List[Node]
+    _forward: List[Set[int]]
+    # the view of _forward[i] if label i is a key, None otherwise
+    # (so that a lookup checks both at once)
+    _views: List[Optional[Neighbors[Node]]]
+    # ids of the labels that are keys, in insertion order
+    _nodes: Dict[int, None]
+
+    def __init__(self) -> None:
+        self._ids = {}
+        self._labels = []
+        self._forward = []
+        self._views = []
+        self._nodes = {}
+
+    def intern(self, label: Node) -> int:
+        '''
+        Returns the id of the given label, storing the label if it's new
+        '''
+        node_id = self._ids.get(label)
+        if node_id is None:
+            node_id = self._ids[label] = len(self._labels)
+            self._labels.append(label)
+            forward: Set[int] = set()
+            self._forward.append(forward)
+            if self.neighbors_are_nodes:
+                self._views.append(Neighbors(self, forward))
+                self._nodes[node_id] = None
+            else:
+                self._views.append(None)
+        return node_id
+
+    def add_node(self, label: Node) -> int:
+        '''
+        Makes label a key (with no edges if it's new) and returns its id
+        '''
+        node_id = self.intern(label)
+        if self._views[node_id] is None:
+            self._views[node_id] = Neighbors(self, self._forward[node_id])
+            self._nodes[node_id] = None
+        return node_id
+
+    def _node_id(self, label: Node) -> int:
+        node_id = self._ids[label]
+        if self._views[node_id] is None:
+            raise KeyError(label)
+        return node_id
+
+    def __getitem__(self, label: Node) -> AbstractSet[Node]:
+        view = self._views[self._ids[label]]
+        if view is None:
+            raise KeyError(label)
+        return view
+
+    def __iter__(self) -> Iterator[Node]:
+        return map(self._labels.__getitem__, self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, label: object) -> bool:
+        node_id = self._ids.get(label)  # type: ignore
+        return node_id is not None and self._views[node_id] is not None
+
+    def has_edge(self, tail: Node, head: Node) -> bool:
+        '''
+        Same as head in g[tail], without going through the view
+        '''
+        view = self._views[self._ids[tail]]
+        if view is None:
+            raise KeyError(tail)
+        return self._ids.get(head) in view._ids
+
+    def add_edge(self, tail: Node, head: Node) -> None:
+        self._forward[self.add_node(tail)].add(self.intern(head))
+
+    def remove_edge(self, tail: Node, head: Node) -> None:
+        '''
+        Raises if the edge is not present
+        '''
+        self._forward[self._node_id(tail)].remove(self._ids[head])
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class InternedAdjacency(Generic[Node]):
+    '''
+    Same attributes as dictgraph_reverse_nodegeneric.Adjacency, as read-only views
+    '''
+    forward: AbstractSet[Node]
+    backward: AbstractSet[Node]
+
+    def __init__(self, forward: AbstractSet[Node], backward: AbstractSet[Node]) -> None:
+        self.forward = forward
+        self.backward = backward
+
+    def __eq__(self, rhs: object) -> bool:
+        if not (hasattr(rhs, 'forward') and hasattr(rhs, 'backward')):
+            return False
+        return bool(self.forward == rhs.forward) and bool(self.backward == rhs.backward)
+
+
+class InternedReverseGraph(InternedGraph[Node]):
+    '''
+    Interned counterpart of dictgraph_reverse_nodegeneric.Graph:
+    g[node].forward and g[node].backward are the successors and predecessors of node
+    Every label is a key, as in dictgraph_reverse_nodegeneric
+    '''
+
+    neighbors_are_nodes = True
+
+    _backward: List[Set[int]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._backward = []
+
+    def intern(self, label: Node) -> int:
+        node_id = super().intern(label)
+        if node_id == len(self._backward):
+            self._backward.append(set())
+        return node_id
+
+    def __getitem__(self, label: Node) -> InternedAdjacency[Node]:  # type: ignore
+        node_id = self._node_id(label)
+        return InternedAdjacency(Neighbors(self, self._forward[node_id]),
+                                 Neighbors(self, self._backward[node_id]))
+
+    def add_edge(self, tail: Node, head: Node) -> None:
+        tail_id, head_id = self.intern(tail), self.intern(head)
+        self._forward[tail_id].add(head_id)
+        self._backward[head_id].add(tail_id)
+
+    def remove_edge(self, tail: Node, head: Node) -> None:
+        tail_id, head_id = self._ids[tail], self._ids[head]
+        self._forward[tail_id].remove(head_id)
+        self._backward[head_id].remove(tail_id)
+
+
+def add_edge(g: InternedGraph[Node], tail: Node, head: Node) -> None:
+    g.add_edge(tail, head)
+
+
+def remove_edge(g: InternedGraph[Node], tail: Node, head: Node) -> None:
+    g.remove_edge(tail, head)
+
+
+def read_graph(s: str, node_type: Callable[[str], Node],
+               cls: Type[G] = InternedGraph, pause_gc: bool = False) -> G:  # type: ignore
+    '''
+    Reads the format of dictgraph_nodegeneric.read_graph: node neighbor1 neighbor2 ...
+    node_type is applied to every token, but each label is kept only once
+    pause_gc: see graph_functions.read_graph
+    '''
+    g = cls()
+    add_node = g.add_node
+    with gc_paused(pause_gc):
+        for line in s.splitlines():
+            node, *neighbors = map(node_type, line.split())
+            add_node(node)
+            for neighbor in neighbors:
+                g.add_edge(node, neighbor)
+    return g
+
+
+def write_graph(g: InternedGraph[Node]) -> str:
+    output: List[str] = []
+    labels = [str(label) for label in g._labels]
+    for node_id in g._nodes:
+        output.append(labels[node_id])
+        neighbor_ids = g._forward[node_id]
+        output.extend([' ' + labels[neighbor_id] for neighbor_id in neighbor_ids])
+        output.append('\n')
+    return ''.join(output)
+
+
+def benchmark(nodes: int = 20000, edges: int = 200000, label_length: int = 40) -> None:
+    '''
+    Compares memory and edge lookup time against dictgraph_nodegeneric's dict of sets,
+    on a random graph with long string labels
+    '''
+    import random
+    import time
+    import tracemalloc
+
+    rng = random.Random(0)
+    labels = ['node-{:0{}d}'.format(i, label_length - 5) for i in range(nodes)]
+    adj: Dict[str, List[str]] = {label: [] for label in labels}
+    for _ in range(edges):
+        adj[rng.choice(labels)].append(rng.choice(labels))
+    text = '\n'.join(' '.join([label] + neighbors) for label, neighbors in adj.items())
+    queries = [(rng.choice(labels), rng.choice(labels)) for _ in range(edges)]
+    del adj, labels
+
+    def lookup_time(has_edge: Callable[[str, str], bool]) -> float:
+        start = time.perf_counter()
+        for tail, head in queries:
+            has_edge(tail, head)
+        return (time.perf_counter() - start) / len(queries) * 1e9
+
+    def report(name: str, g: Mapping[str, AbstractSet[str]], memory: int) -> None:
+        print('{:>12}: {:.1f} MB, {:.0f} ns per `head in g[tail]`'.format(
+            name, memory / 2 ** 20, lookup_time(lambda tail, head: head in g[tail])))
+
+    tracemalloc.start()
+    plain = dictgraph_nodegeneric.read_graph(text, str)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    report('dict of sets', plain, memory)
+    del plain
+
+    tracemalloc.start()
+    interned: InternedGraph[str] = read_graph(text, str)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    report('interned', interned, memory)
+    print('{:>12}  {:.0f} ns per g.has_edge(tail, head)'.format(
+        '', lookup_time(interned.has_edge)))
@@ -2,7 +2,7 @@ from typing import (
     TypeVar, Generic, Set, List, Callable, Dict, Optional, DefaultDict
 )
 from collections import defaultdict
-import pytest  # type: ignore
+from .graph_functions import gc_paused
 
 NodeValue = TypeVar('NodeValue')
 
@@ -18,13 +18,15 @@ class Node(Generic[NodeValue]):
 Graph = Dict[Node[NodeValue], Set[Node[NodeValue]]]
 
 
-def read_graph(s: str, node_type: Callable[[str], NodeValue]) -> Graph[NodeValue]:
+def read_graph(s: str, node_type: Callable[[str], NodeValue],
+               pause_gc: bool = False) -> Graph[NodeValue]:
     '''
     Args:
     s: graph in serialized format
     one line per node: node_id node_value neighbor1_id neighbor2_id ...
     leading/trailing/repeated whitespace ignored
     node_id must be integers
+    pause_gc: see graph_functions.read_graph
 
     Returns:
     graph constructed from input if input is valid
@@ -33,12 +35,13 @@ def read_graph(s: str, node_type: Callable[[str], NodeValue]) -> Graph[NodeValue
 
     g: Graph[NodeValue] = {}
     nodes: DefaultDict[int, Node[NodeValue]] = defaultdict(Node)
-    for line in s.splitlines():
-        node_id, value, *neighbor_ids = line.split()
-        node = nodes[int(node_id)]
-        node.value = node_type(value)
-        neighbors = map(lambda neighbor_id: nodes[int(neighbor_id)], neighbor_ids)
-        g[node] = set(neighbors)
+    get_node = nodes.__getitem__
+    with gc_paused(pause_gc):
+        for line in s.splitlines():
+            node_id, value, *neighbor_ids = line.split()
+            node = get_node(int(node_id))
+            node.value = node_type(value)
+            g[node] = set(map(get_node, map(int, neighbor_ids)))
     return g
 
 
@@ -76,54 +79,3 @@ def labeled_graph_eq(g1: Graph[NodeValue], g2: Graph[NodeValue]) -> bool:
             return False
 
     return True
-
-
-def get_test_graph() -> Graph[str]:
-    a = Node('A')
-    b = Node('B')
-    c = Node('C')
-    d = Node('D')
-    return {a: {a, b, c}, b: set(),
-            c: {b}, d: set()}
-
-
-def test_basic_functionality() -> None:
-    g = get_test_graph()
-    assert {str(node) for node in g} == {'<Node A>', '<Node B>', '<Node C>', '<Node D>'}
-
-
-def test_labeled_eq() -> None:
-    g1 = get_test_graph()
-    g2 = get_test_graph()
-    assert labeled_graph_eq(g1, g2)
-
-    nodes = list(g1)
-    nodes[0].value, nodes[1].value = nodes[1].value, nodes[0].value
-    assert not labeled_graph_eq(g1, g2)
-
-    g1 = get_test_graph()
-    nodes = list(g1)
-    nodes[0].value = 'Z'
-    assert not labeled_graph_eq(g1, g2)
-
-    for node in g1:
-        node.value = 'Z'
-    for node in g2:
-        node.value = 'Z'
-    with pytest.raises(NotImplementedError):
-        labeled_graph_eq(g1, g2)
-
-    del g1[nodes[0]]
-    assert not labeled_graph_eq(g1, g2)
-
-
-def test_serialization() -> None:
-    g = get_test_graph()
-
-    g_str = '''0 A 0 1 2
-    1 B
-    2 C 1
-    3 D'''
-
-    assert labeled_graph_eq(read_graph(g_str, str), g)
-    assert labeled_graph_eq(read_graph(write_graph(g), str), g)
@@ -21,16 +21,3 @@ def write_graph(g: Graph[Node]) -> str:
         output.extend([' ' + str(neighbor) for neighbor in neighbors])
         output.append('\n')
     return ''.join(output)
-
-
-def test_serialization() -> None:
-    graph: Graph[str] = {'A': {'A', 'B', 'C'}, 'B': set(),
-                         'C': {'B'}, 'D': set()}
-
-    g_str = '''A A B C
-    B
-    C B
-    D'''
-
-    assert read_graph(g_str, str) == graph
-    assert read_graph(write_graph(graph), str) == graph
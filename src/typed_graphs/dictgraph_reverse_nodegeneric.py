@@ -58,25 +58,3 @@ def write_graph(g: Graph[Node]) -> str:
         output.extend([' ' + str(neighbor) for neighbor in adjacency.forward])
         output.append('\n')
     return ''.join(output)
-
-
-def test_graph() -> None:
-    graph: Graph[str] = {'A': Adjacency(), 'B': Adjacency(),
-                         'C': Adjacency(), 'D': Adjacency()}
-    graph['A'].forward = {'A', 'B', 'C'}
-    graph['A'].backward = {'A'}
-    graph['B'].backward = {'A', 'C'}
-    graph['C'].forward = {'B'}
-    graph['C'].backward = {'A'}
-
-    g_str = '''A A B C
-    B
-    C B
-    D'''
-
-    assert read_graph(g_str, str) == graph
-    assert read_graph(write_graph(graph), str) == graph
-
-    remove_edge(graph, 'A', 'B')
-    assert graph['A'].forward == {'A', 'C'}
-    assert graph['B'].backward == {'C'}
@@ -1,13 +1,12 @@
 # module: graph.py
 from typing import (
     Set, Dict, DefaultDict, Iterable, Iterator,
-    Any, Type, AbstractSet, TypeVar
+    Any, Type, AbstractSet, TypeVar, Optional
 )
-from collections import defaultdict
-from io import StringIO
-import pytest  # type: ignore
-from igraph import IGraphMutable, INodeMutable, InvalidOperation
-from graph_functions import generic_tests
+from collections import defaultdict, Counter
+from .igraph import IGraphMutable, INodeMutable, InvalidOperation
+from .degree_index import DegreeIndex
+from .ordered_set import OrderedSet
 
 
 T = TypeVar('T', bound='Node')
@@ -17,9 +16,9 @@ U = TypeVar('U', bound='Graph')
 class Node(INodeMutable):
     _adj: 'Set[Node]'
 
-    def __init__(self, value: Any = None) -> None:
+    def __init__(self, value: Any = None, ordered: bool = False) -> None:
         self.value = value
-        self._adj = set()
+        self._adj = OrderedSet() if ordered else set()  # type: ignore
 
     def __iter__(self: T) -> Iterator[T]:
         return iter(self._adj)  # type: ignore
@@ -37,9 +36,54 @@ class Node(INodeMutable):
 # this is a concrete implementation, using concrete Node class
 class Graph(IGraphMutable):
     _nodes: Set[Node]
+    # incremented on every successful mutation, so that derived data can detect staleness
+    _version: int
+    # maintained only after enable_degree_index()
+    out_degrees: 'Optional[DegreeIndex[Node]]' = None
+    in_degrees: 'Optional[DegreeIndex[Node]]' = None
 
-    def __init__(self) -> None:
-        self._nodes = set()
+    def __init__(self, ordered: bool = False) -> None:
+        '''
+        If ordered, nodes and adjacencies are kept in insertion order (see OrderedSet),
+        so iteration, and write_graph output, only depend on the sequence of mutations
+        By default they are sets, whose order changes from run to run with object addresses
+        '''
+        self.ordered = ordered
+        self._nodes = OrderedSet() if ordered else set()  # type: ignore
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def enable_degree_index(self) -> None:
+        '''
+        Builds out_degrees and in_degrees in O(V + E)
+        From then on they are kept up to date in O(1) per added or removed edge,
+        so top-k, min/max degree and histogram queries don't scan the graph
+        '''
+        in_degree = Counter(head for node in self._nodes for head in node._adj)
+        self.out_degrees = DegreeIndex()
+        self.in_degrees = DegreeIndex()
+        for node in self._nodes:
+            self.out_degrees.add(node, len(node._adj))
+            self.in_degrees.add(node, in_degree[node])
+
+    def _index_node(self, node: Node) -> None:
+        if self.out_degrees is not None:
+            self.out_degrees.add(node)
+        if self.in_degrees is not None and self.in_degrees is not self.out_degrees:
+            self.in_degrees.add(node)
+
+    def _index_edge(self, tail: Node, head: Node, delta: int) -> None:
+        # callers check that the index is enabled, keeping the disabled path to one test
+        assert self.out_degrees is not None and self.in_degrees is not None
+        if delta > 0:
+            self.out_degrees.increment(tail)
+            self.in_degrees.increment(head)
+        else:
+            self.out_degrees.decrement(tail)
+            self.in_degrees.decrement(head)
 
     def __iter__(self) -> Iterator[Node]:
         return iter(self._nodes)
@@ -55,8 +99,10 @@ class Graph(IGraphMutable):
         Creates a new node that stores the provided value
         Adds the new node to the graph and returns it
         '''
-        n = Node(value)
+        n = Node(value, self.ordered)
         self._nodes.add(n)
+        self._index_node(n)
+        self._version += 1
         return n
 
     def remove_node(self, node: Node) -> None:  # type: ignore
@@ -65,9 +111,23 @@ class Graph(IGraphMutable):
         Raises if node is not present
         '''
         assert isinstance(node, Node)
-        for v in self:
-            v._adj.discard(node)
+        if self.out_degrees is None or self.in_degrees is None:
+            for v in self:
+                v._adj.discard(node)
+        else:
+            if node not in self._nodes:
+                raise KeyError(node)
+            node._adj.discard(node)
+            for v in self:
+                if node in v._adj:
+                    v._adj.remove(node)
+                    self.out_degrees.decrement(v)
+            for head in node._adj:
+                self.in_degrees.decrement(head)
+            self.out_degrees.remove(node)
+            self.in_degrees.remove(node)
         self._nodes.remove(node)
+        self._version += 1
 
     def add_edge(self, tail: Node, head: Node) -> None:  # type: ignore
         '''
@@ -77,6 +137,22 @@ class Graph(IGraphMutable):
         if head in tail:
             raise InvalidOperation('Attempted to add a duplicate edge')
         tail._adj.add(head)
+        if self.out_degrees is not None:
+            self._index_edge(tail, head, 1)
+        self._version += 1
+
+    def add_edges(self, tail: Node, heads: Iterable[Node]) -> None:  # type: ignore
+        '''
+        Adds edges from tail to each of heads, skipping duplicates
+        '''
+        if self.out_degrees is None:
+            tail._adj.update(heads)
+        else:
+            for head in heads:
+                if head not in tail._adj:
+                    tail._adj.add(head)
+                    self._index_edge(tail, head, 1)
+        self._version += 1
 
     def remove_edge(self, tail: Node, head: Node) -> None:  # type: ignore
         '''
@@ -84,11 +160,9 @@ class Graph(IGraphMutable):
         Raises if it's not present
         '''
         tail._adj.remove(head)
+        if self.out_degrees is not None:
+            self._index_edge(tail, head, -1)
+        self._version += 1
 
     def __repr__(self) -> str:
         return '<Graph with {} nodes>\nNodes: {}'.format(len(self), self._nodes)
-
-
-@pytest.mark.parametrize('test_func', generic_tests)
-def test_graph(test_func):  # type: ignore
-    test_func(Graph)
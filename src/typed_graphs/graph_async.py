@@ -0,0 +1,110 @@
+# module: graph_async.py
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, DefaultDict, Iterable, List, Optional,
+    Set, Tuple, Type, TypeVar, Union
+)
+from collections import defaultdict, deque
+from concurrent.futures import Executor
+import asyncio
+from .igraph import IGraphMutable, INode, INodeMutable, InvalidOperation
+
+G = TypeVar('G', bound=IGraphMutable)
+
+ParsedLine = Tuple[str, Any, List[str]]
+
+
+def parse_lines(lines: Iterable[Union[str, bytes]],
+                node_type: Callable[[str], Any]) -> List[ParsedLine]:
+    '''
+    Splits lines in the format used by graph_functions.read_graph
+    Runs without touching the graph, so it can be offloaded to an executor
+    '''
+    result: List[ParsedLine] = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode()
+        node_id, value, *neighbor_ids = line.split()
+        result.append((node_id, node_type(value), neighbor_ids))
+    return result
+
+
+async def read_graph_async(cls: Type[G], s: AsyncIterable[Union[str, bytes]],
+                           node_type: Callable[[str], Any], *, yield_every: int = 1000,
+                           executor: Optional[Executor] = None) -> G:
+    '''
+    Same as graph_functions.read_graph, but reads from an async stream of lines
+    (str or utf-8 bytes, e.g. asyncio.StreamReader) and yields to the event loop
+    every yield_every lines
+
+    If executor is provided, lines are split and node_type is applied in it,
+    one batch of yield_every lines at a time; only graph updates run on the event loop
+    With a ProcessPoolExecutor, node_type has to be picklable
+    '''
+    g = cls()
+    nodes: DefaultDict[str, INodeMutable] = defaultdict(g.add_node)
+    loop = asyncio.get_running_loop()
+
+    def add(parsed: List[ParsedLine]) -> None:
+        for node_id, value, neighbor_ids in parsed:
+            nodes[node_id].value = value
+            for neighbor_id in neighbor_ids:
+                try:
+                    g.add_edge(nodes[node_id], nodes[neighbor_id])
+                except InvalidOperation:
+                    pass  # ignore duplicate edges (common in undirected graphs)
+
+    batch: List[Union[str, bytes]] = []
+    async for line in s:
+        batch.append(line)
+        if len(batch) >= yield_every:
+            if executor is None:
+                add(parse_lines(batch, node_type))
+            else:
+                add(await loop.run_in_executor(executor, parse_lines, batch, node_type))
+            batch = []
+            await asyncio.sleep(0)
+    if executor is None:
+        add(parse_lines(batch, node_type))
+    else:
+        add(await loop.run_in_executor(executor, parse_lines, batch, node_type))
+    return g
+
+
+async def bfs_async(source: INode, yield_every: int = 1000) -> AsyncIterator[INode]:
+    '''
+    Yields nodes reachable from source in breadth-first order,
+    giving control back to the event loop every yield_every nodes
+    '''
+    seen: Set[INode] = {source}
+    queue = deque([source])
+    count = 0
+    while queue:
+        node = queue.popleft()
+        yield node
+        count += 1
+        if count % yield_every == 0:
+            await asyncio.sleep(0)
+        for neighbor in node:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+
+
+async def dfs_async(source: INode, yield_every: int = 1000) -> AsyncIterator[INode]:
+    '''
+    Yields nodes reachable from source in depth-first preorder,
+    giving control back to the event loop every yield_every nodes
+    '''
+    seen: Set[INode] = set()
+    stack = [source]
+    count = 0
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        yield node
+        count += 1
+        if count % yield_every == 0:
+            await asyncio.sleep(0)
+        stack.extend(neighbor for neighbor in node if neighbor not in seen)
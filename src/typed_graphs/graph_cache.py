@@ -0,0 +1,103 @@
+# module: graph_cache.py
+from typing import (
+    Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple, TypeVar
+)
+from collections import OrderedDict
+import functools
+from .graph import Graph, Node
+
+
+R = TypeVar('R')
+
+CacheKey = Tuple[Callable[..., Any], Tuple[Hashable, ...], Tuple[Tuple[str, Hashable], ...]]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class GraphCache:
+    '''
+    Memoizes results of algorithms run against a single graph
+
+    An algorithm is any callable that takes the graph as its first argument;
+    the remaining arguments (and keyword arguments) must be hashable
+    Results are dropped as soon as the graph version changes, i.e. after any
+    add_node / remove_node / add_edge / remove_edge
+    Changing node.value directly does not change the version; call clear() after that
+
+    At most maxsize results are kept, least recently used are evicted first
+    '''
+
+    _results: 'OrderedDict[CacheKey, Any]'
+
+    def __init__(self, graph: Graph, maxsize: int = 128) -> None:
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive')
+        self.graph = graph
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._version = graph.version
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __call__(self, func: Callable[..., R], *args: Hashable, **kwargs: Hashable) -> R:
+        '''
+        Returns func(graph, *args, **kwargs), computing it only if not cached
+        '''
+        self._check_version()
+        key: CacheKey = (func, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self._results[key]
+        except KeyError:
+            pass
+        else:
+            self._results.move_to_end(key)
+            self._hits += 1
+            return result  # type: ignore
+
+        self._misses += 1
+        result = func(self.graph, *args, **kwargs)
+        # func may have mutated the graph; don't cache a result we can't trust
+        if self._version == self.graph.version:
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def cached(self, func: Callable[..., R]) -> Callable[..., R]:
+        '''
+        Decorator version of __call__; the decorated function omits the graph argument
+        '''
+        @functools.wraps(func)
+        def wrapper(*args: Hashable, **kwargs: Hashable) -> R:
+            return self(func, *args, **kwargs)
+        return wrapper
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def info(self) -> CacheInfo:
+        self._check_version()
+        return CacheInfo(self._hits, self._misses, self._evictions, self._invalidations,
+                         len(self._results), self.maxsize)
+
+    def _check_version(self) -> None:
+        if self._version != self.graph.version:
+            if self._results:
+                self._invalidations += 1
+                self._results.clear()
+            self._version = self.graph.version
@@ -1,37 +1,77 @@
 # module: graph_functions.py
 from typing import (
-    TypeVar, Generic, List, Set, Dict, Callable, DefaultDict, Iterable,
-    Any, Type
+    TypeVar, Generic, List, Set, Dict, Callable, DefaultDict, Iterable, Iterator,
+    Any, Type, Mapping, Optional
 )
 from collections import defaultdict
-from io import StringIO
-import re
-import pytest  # type: ignore
-from igraph import IGraph, IGraphMutable, INode, INodeMutable, InvalidOperation
+from contextlib import contextmanager
+import gc
+from .igraph import IGraph, IGraphMutable, INode, INodeMutable, InvalidOperation
 
 G = TypeVar('G', bound=IGraphMutable)
 
 
-def read_graph(cls: Type[G], s: Iterable[str], node_type: Callable[[str], Any]) -> G:
+@contextmanager
+def gc_paused(pause: bool = True) -> Iterator[None]:
+    '''
+    Disables the cyclic garbage collector for the duration of the block (if pause)
+
+    Reading a graph allocates a node and an adjacency set per line, none of
+    which become garbage; yet every few hundred allocations trigger a collection,
+    and the older generations end up traversing everything built so far,
+    which dominates the load time of large graphs
+    The collector is process-wide, so other threads are affected as well
+    '''
+    enabled = pause and gc.isenabled()
+    if enabled:
+        gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def read_graph(cls: Type[G], s: Iterable[str], node_type: Callable[[str], Any],
+               pause_gc: bool = False) -> G:
+    '''
+    Reads lines in the format node_id value neighbor1_id neighbor2_id ...
+    leading/trailing/repeated whitespace ignored
+
+    pause_gc disables the cyclic garbage collector while reading (see gc_paused);
+    that speeds up loading large graphs, but stops collection in the whole process,
+    other threads and async tasks included, until read_graph returns
+    '''
     g = cls()
     nodes: DefaultDict[str, INodeMutable] = defaultdict(g.add_node)
-
-    for line in s:
-        node_id, value, *neighbor_ids = line.split()
-        nodes[node_id].value = node_type(value)
-        for neighbor_id in neighbor_ids:
-            try:
-                g.add_edge(nodes[node_id], nodes[neighbor_id])
-            except InvalidOperation:
-                pass  # ignore duplicate edges (common in undirected graphs)
+    get_node = nodes.__getitem__
+
+    with gc_paused(pause_gc):
+        for line in s:
+            node_id, value, *neighbor_ids = line.split()
+            node = get_node(node_id)
+            node.value = node_type(value)
+            # add_edges skips duplicate edges (common in undirected graphs)
+            g.add_edges(node, map(get_node, neighbor_ids))
     return g
 
 
-def write_graph(g: IGraph) -> str:
+def write_graph(g: IGraph, ids: Optional[Mapping[INode, Any]] = None) -> str:
+    '''
+    Serializes graph in the format accepted by read_graph
+    Nodes are numbered 0, 1, ... unless ids provides the id of each node and neighbor;
+    that allows writing parts of a larger graph separately
+    Nodes and neighbors are written in iteration order; for graph.Graph(ordered=True)
+    that makes the output the same for the same sequence of mutations
+    '''
     output: List[str] = []
-    nodes = {node: node_id for node_id, node in enumerate(g)}
-    for node, node_id in nodes.items():
-        output.append(str(node_id))
+    nodes: Mapping[INode, Any]
+    if ids is None:
+        nodes = {node: node_id for node_id, node in enumerate(g)}
+    else:
+        nodes = ids
+    for node in g:
+        output.append(str(nodes[node]))
         output.append(' ' + str(node.value))
         output.extend([' ' + str(nodes[neighbor]) for neighbor in node])
         output.append('\n')
@@ -63,96 +103,85 @@ def labeled_graph_eq(g1: IGraph, g2: IGraph) -> bool:
     return True
 
 
-def get_test_graph(cls: Type[G]) -> G:
-    g = cls()
-    a = g.add_node('A')
-    b = g.add_node('B')
-    c = g.add_node('C')
-    g.add_node('D')
-    if g.allow_loops:  # can't use cls.allow_loops due to type syse
-        g.add_edge(a, a)
-    g.add_edge(a, b)
-    g.add_edge(a, c)
-    try:
-        g.add_edge(c, a)
-    except InvalidOperation:
-        # only add reverse edge to directed graphs
-        pass
-    g.add_edge(c, b)
-
-    return g
-
+def get_benchmark_corpus(nodes: int = 50000, edges: int = 500000, seed: int = 0) -> str:
+    '''
+    Random directed graph serialized as in write_graph, with integer values
+    '''
+    import random
+    rng = random.Random(seed)
+    adj: List[List[int]] = [[] for _ in range(nodes)]
+    for _ in range(edges):
+        adj[rng.randrange(nodes)].append(rng.randrange(nodes))
+    return ''.join('{} {} {}\n'.format(node_id, node_id, ' '.join(map(str, neighbors)))
+                   for node_id, neighbors in enumerate(adj))
 
-def get_test_serialized_graph(allow_loops: bool) -> StringIO:
-    s = '0 A 0 1 2\n' if allow_loops else '0 A 1 2\n'
-    s += '''1 B
-    2 C 0 1
-    3 D'''
-    return StringIO(s)
 
+def benchmark(repeat: int = 3) -> None:
+    '''
+    Compares read_graph, with and without pause_gc, with the per-edge add_edge loop it replaced
 
-def generic_test_basic_functions(cls: Type[IGraphMutable]) -> None:
-    g = cls()
-    v = g.add_node()
-    w = g.add_node()
-    g.add_edge(v, w)
-    with pytest.raises(InvalidOperation):
-        g.add_edge(v, w)
-
-    g = get_test_graph(cls)
-    assert str(g).startswith('<Graph with 4 nodes>\n')
-
-    node_str = {re.sub(r' at \d+', '', str(node)) for node in g}
-    assert node_str == {'<Node A>', '<Node B>', '<Node C>', '<Node D>'}
-    # need list(), otherwise set changes during iteration
-    # type system limitations cause incorrect inference and don't allow isinstance assertion
-    for v in list(g):  # type: ignore
-        g.remove_node(v)
-    assert len(g) == 0
-
-    g = get_test_graph(cls)
-    for v in g:
-        for w in list(v):  # type: ignore
-            g.remove_edge(v, w)
-    for v in g:
-        assert len(list(v)) == 0
-
-
-def generic_test_labeled_eq(cls: Type[IGraphMutable]) -> None:
-    g1 = get_test_graph(cls)
-    g2 = get_test_graph(cls)
-    assert labeled_graph_eq(g1, g2)
-
-    nodes = sorted(g1, key=lambda node: len(node))
-    # ensure we swap non-equivalent nodes
-    # works for both directed and undirected graphs,
-    # since our test graph has one node with 0 degree
-    nodes[0].value, nodes[-1].value = nodes[-1].value, nodes[0].value
-    assert not labeled_graph_eq(g1, g2)
-
-    g1 = get_test_graph(cls)
-    nodes = list(g1)
-    nodes[0].value = 'Z'
-    assert not labeled_graph_eq(g1, g2)
-
-    for node in g1:
-        node.value = 'Z'
-    for node in g2:
-        node.value = 'Z'
-    with pytest.raises(NotImplementedError):
-        labeled_graph_eq(g1, g2)
-
-    # mypy does not infer nodes type correctly; isinstance assertion disallowed because of generics
-    g1.remove_node(nodes[0])  # type: ignore
-    assert not labeled_graph_eq(g1, g2)
-
-
-def generic_test_serialization(cls: Type[IGraphMutable]) -> None:
-    g = get_test_graph(cls)
-    g_str = get_test_serialized_graph(g.allow_loops)
-    assert labeled_graph_eq(read_graph(cls, g_str, str), g)
-    assert labeled_graph_eq(read_graph(cls, StringIO(write_graph(g)), str), g)
-
-
-generic_tests = [generic_test_basic_functions, generic_test_labeled_eq,
-                 generic_test_serialization]
+    Then splits the load time of the readers that convert ids with int()
+    (dictgraph_nodeclass, setgraph_nodeclass) into tokenizing, int conversion
+    and building the graph; tokenizing and converting are a small share of it,
+    which is why there's no bulk integer tokenizer: the time goes into creating
+    nodes and adjacency sets, and the collector passes that creation triggers
+    '''
+    from functools import partial
+    import time
+    from .graph import Graph
+    from .graph_reverse import ReversibleGraph
+    from .graph_undirected import UndirectedGraph
+    from . import dictgraph_nodeclass, setgraph_nodeclass
+
+    def best_time(func: Callable[[], Any]) -> float:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def read_graph_per_edge(cls: Type[G], s: Iterable[str], node_type: Callable[[str], Any]) -> G:
+        g = cls()
+        nodes: DefaultDict[str, INodeMutable] = defaultdict(g.add_node)
+        for line in s:
+            node_id, value, *neighbor_ids = line.split()
+            nodes[node_id].value = node_type(value)
+            for neighbor_id in neighbor_ids:
+                try:
+                    g.add_edge(nodes[node_id], nodes[neighbor_id])
+                except InvalidOperation:
+                    pass
+        return g
+
+    def read_graph_gc(cls: Type[G], s: Iterable[str], node_type: Callable[[str], Any]) -> G:
+        return read_graph(cls, s, node_type, pause_gc=True)
+
+    def tokenize(s: str) -> None:
+        for line in s.splitlines():
+            node_id, value, *neighbor_ids = line.split()
+
+    def tokenize_int(s: str) -> None:
+        for line in s.splitlines():
+            node_id, value, *neighbor_ids = line.split()
+            int(node_id)
+            list(map(int, neighbor_ids))
+
+    corpus = get_benchmark_corpus()
+    lines = corpus.splitlines()
+    for cls in [Graph, ReversibleGraph, UndirectedGraph]:
+        timings = [best_time(partial(read, cls, lines, int))
+                   for read in [read_graph_per_edge, read_graph, read_graph_gc]]
+        print('{}: per edge {:.2f}s, add_edges {:.2f}s, add_edges + pause_gc {:.2f}s'.format(
+            cls.__name__, *timings))
+
+    print('tokenize {:.2f}s, tokenize + int {:.2f}s'.format(
+        best_time(partial(tokenize, corpus)), best_time(partial(tokenize_int, corpus))))
+    for module in [dictgraph_nodeclass, setgraph_nodeclass]:
+        timings = [best_time(partial(module.read_graph, corpus, int, pause_gc))
+                   for pause_gc in [False, True]]
+        print('{}.read_graph: {:.2f}s, with pause_gc {:.2f}s'.format(module.__name__, *timings))
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,229 @@
+# module: graph_multi.py
+from typing import (
+    Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+)
+from array import array
+from collections import defaultdict
+from .igraph import INodeMutable, IGraphMutable
+
+
+class MultiNode(INodeMutable):
+    # neighbor -> ids of the parallel edges between this node and the neighbor
+    _adj: 'Dict[MultiNode, List[int]]'
+    _back: 'Dict[MultiNode, List[int]]'
+
+    def __init__(self, value: Any = None) -> None:
+        self.value = value
+        self._adj = {}
+        self._back = {}
+
+    # iteration visits each neighbor once, regardless of the number of parallel edges
+    def __iter__(self) -> 'Iterator[MultiNode]':
+        return iter(self._adj)
+
+    def __len__(self) -> int:
+        return len(self._adj)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._adj
+
+    def __repr__(self) -> str:
+        return '<Node {} at {}>'.format(self.value, id(self))
+
+
+class MultiGraph(IGraphMutable):
+    '''
+    Directed graph that allows parallel edges
+
+    Edges are numbered 0 .. edge_count() - 1; endpoints and attributes are stored
+    column-wise, one array per attribute, indexed by edge id
+    Removing an edge moves the last edge into its place, so edge ids are only
+    stable while no edges are removed
+    '''
+
+    _nodes: Set[MultiNode]
+    _tails: List[MultiNode]
+    _heads: List[MultiNode]
+    columns: 'Dict[str, array[Any]]'
+
+    def __init__(self, attributes: Optional[Mapping[str, str]] = None) -> None:
+        '''
+        attributes maps attribute names to array typecodes, e.g. {'time': 'd', 'count': 'q'}
+        '''
+        self._nodes = set()
+        self._tails = []
+        self._heads = []
+        self.columns = {name: array(typecode) for name, typecode in (attributes or {}).items()}
+
+    def __iter__(self) -> Iterator[MultiNode]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._nodes
+
+    def add_node(self, value: Any = None) -> MultiNode:
+        n = MultiNode(value)
+        self._nodes.add(n)
+        return n
+
+    def remove_node(self, node: MultiNode) -> None:  # type: ignore
+        '''
+        Removes the specified node and all edges to and from it, in O(degree)
+        Raises if node is not present
+        '''
+        self._nodes.remove(node)
+        edge_ids = {edge_id for ids in node._adj.values() for edge_id in ids}
+        edge_ids.update(edge_id for ids in node._back.values() for edge_id in ids)
+        # removing the largest id first guarantees that the edge moved into
+        # the freed slot is never one we still have to remove
+        for edge_id in sorted(edge_ids, reverse=True):
+            self.remove_edge_id(edge_id)
+
+    def add_edge(self, tail: MultiNode, head: MultiNode,  # type: ignore
+                 **attributes: Any) -> int:
+        '''
+        Adds a new edge, even if tail and head are already connected
+        Attributes that are not specified are set to 0
+        Returns the id of the new edge
+        '''
+        unknown = attributes.keys() - self.columns.keys()
+        if unknown:
+            raise KeyError('Unknown edge attributes: {}'.format(sorted(unknown)))
+        edge_id = len(self._tails)
+        for name, column in self.columns.items():
+            column.append(attributes.get(name, 0))
+        self._tails.append(tail)
+        self._heads.append(head)
+        tail._adj.setdefault(head, []).append(edge_id)
+        head._back.setdefault(tail, []).append(edge_id)
+        return edge_id
+
+    def remove_edge(self, tail: MultiNode, head: MultiNode) -> None:  # type: ignore
+        '''
+        Removes the most recently added edge from tail to head
+        Raises if there are none
+        '''
+        self.remove_edge_id(tail._adj[head][-1])
+
+    def remove_edge_id(self, edge_id: int) -> None:
+        tail, head = self._tails[edge_id], self._heads[edge_id]
+        self._unlink(tail._adj, head, edge_id)
+        self._unlink(head._back, tail, edge_id)
+
+        last = len(self._tails) - 1
+        if edge_id != last:
+            last_tail, last_head = self._tails[last], self._heads[last]
+            self._relink(last_tail._adj[last_head], last, edge_id)
+            self._relink(last_head._back[last_tail], last, edge_id)
+            self._tails[edge_id] = last_tail
+            self._heads[edge_id] = last_head
+            for column in self.columns.values():
+                column[edge_id] = column[last]
+        self._tails.pop()
+        self._heads.pop()
+        for column in self.columns.values():
+            column.pop()
+
+    @staticmethod
+    def _unlink(adjacency: 'Dict[MultiNode, List[int]]', node: MultiNode, edge_id: int) -> None:
+        ids = adjacency[node]
+        ids.remove(edge_id)
+        if not ids:
+            del adjacency[node]
+
+    @staticmethod
+    def _relink(ids: List[int], old: int, new: int) -> None:
+        ids[ids.index(old)] = new
+
+    def edge_count(self, tail: Optional[MultiNode] = None,
+                   head: Optional[MultiNode] = None) -> int:
+        '''
+        Number of edges from tail to head; with only tail, edges leaving tail;
+        with only head, edges entering head; with neither, all edges
+        Parallel edges are counted separately
+        '''
+        if tail is not None and head is not None:
+            return len(tail._adj.get(head, ()))
+        if tail is not None:
+            return sum(map(len, tail._adj.values()))
+        if head is not None:
+            return sum(map(len, head._back.values()))
+        return len(self._tails)
+
+    def edge_ids(self, tail: MultiNode, head: MultiNode) -> List[int]:
+        return list(tail._adj.get(head, ()))
+
+    def edges(self) -> Iterator[Tuple[MultiNode, MultiNode, int]]:
+        '''
+        Yields (tail, head, edge_id) for every edge, including each parallel edge
+        '''
+        return zip(self._tails, self._heads, range(len(self._tails)))
+
+    def attributes(self, edge_id: int) -> Dict[str, Any]:
+        return {name: column[edge_id] for name, column in self.columns.items()}
+
+    def aggregate(self, tail: MultiNode, head: MultiNode, attribute: str,
+                  func: Callable[[Iterable[Any]], Any] = sum) -> Any:
+        '''
+        Applies func (sum, max, min, ...) to the attribute values of all edges from tail to head
+        '''
+        column = self.columns[attribute]
+        return func(column[edge_id] for edge_id in tail._adj.get(head, ()))
+
+    def parallel_edge_counts(self) -> Iterator[Tuple[MultiNode, MultiNode, int]]:
+        '''
+        Yields (tail, head, number of edges) for every connected pair
+        '''
+        for tail in self._nodes:
+            for head, ids in tail._adj.items():
+                yield tail, head, len(ids)
+
+    def __repr__(self) -> str:
+        return '<Graph with {} nodes>\nNodes: {}'.format(len(self), self._nodes)
+
+
+def read_multigraph(s: Iterable[str], node_type: Callable[[str], Any],
+                    attributes: Optional[Mapping[str, str]] = None) -> MultiGraph:
+    '''
+    Reads the graph_functions.read_graph format, extended with edge attributes:
+    node_id value neighbor_id@name=value,name=value ...
+    A neighbor may be repeated to add parallel edges; attributes may be omitted
+    '''
+    g = MultiGraph(attributes)
+    converters = {name: float if typecode in 'fd' else int
+                  for name, typecode in (attributes or {}).items()}
+    nodes: DefaultDict[str, MultiNode] = defaultdict(g.add_node)
+
+    for line in s:
+        node_id, value, *edges = line.split()
+        node = nodes[node_id]
+        node.value = node_type(value)
+        for edge in edges:
+            neighbor_id, _, attribute_str = edge.partition('@')
+            edge_attributes: Dict[str, Any] = {}
+            if attribute_str:
+                for item in attribute_str.split(','):
+                    name, _, attribute_value = item.partition('=')
+                    edge_attributes[name] = converters[name](attribute_value)
+            g.add_edge(node, nodes[neighbor_id], **edge_attributes)
+    return g
+
+
+def write_multigraph(g: MultiGraph) -> str:
+    output: List[str] = []
+    nodes: Dict[MultiNode, int] = {node: node_id for node_id, node in enumerate(g._nodes)}
+    columns = list(g.columns.items())
+    for node, node_id in nodes.items():
+        output.append(str(node_id))
+        output.append(' ' + str(node.value))
+        for neighbor, ids in node._adj.items():
+            for edge_id in ids:
+                output.append(' ' + str(nodes[neighbor]))
+                if columns:
+                    output.append('@' + ','.join('{}={}'.format(name, column[edge_id])
+                                                 for name, column in columns))
+        output.append('\n')
+    return ''.join(output)
@@ -0,0 +1,265 @@
+# module: graph_parallel.py
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+from array import array
+from collections import deque
+from multiprocessing import shared_memory
+from multiprocessing.pool import Pool
+import multiprocessing
+import os
+from .igraph import IGraph, INode
+from .graph import Graph
+
+
+# typecodes of the shared arrays; 'q' arrays hold node indices or offsets
+TYPECODES = {
+    'indptr': 'q', 'indices': 'q',  # outgoing edges
+    'in_indptr': 'q', 'in_indices': 'q',  # incoming edges
+    'dist': 'q', 'contrib': 'd', 'sums': 'd',  # per-node algorithm state
+}
+
+# arrays used by the kernels below; set by _attach in pool workers,
+# and by the engine itself when it runs a kernel in the current process
+# values are memoryviews cast to TYPECODES[key], so their item type depends on the key
+_shared: Dict[str, Any] = {}
+_segments: List[shared_memory.SharedMemory] = []
+
+
+def _view(segment: shared_memory.SharedMemory, key: str) -> Any:
+    # the typecode is only known at runtime, which the memoryview.cast overloads can't express
+    return cast(memoryview, segment.buf).cast(TYPECODES[key])  # type: ignore[call-overload]
+
+
+def _attach(names: Dict[str, str]) -> None:
+    for key, name in names.items():
+        segment = shared_memory.SharedMemory(name)
+        _segments.append(segment)
+        _shared[key] = _view(segment, key)
+
+
+def _expand(frontier: Sequence[int]) -> List[int]:
+    indptr, indices, dist = _shared['indptr'], _shared['indices'], _shared['dist']
+    unvisited: List[int] = []
+    for tail in frontier:
+        for head in indices[indptr[tail]:indptr[tail + 1]]:
+            if dist[head] < 0:
+                unvisited.append(head)
+    return unvisited
+
+
+def _pull(bounds: Tuple[int, int]) -> None:
+    indptr, indices, contrib = _shared['in_indptr'], _shared['in_indices'], _shared['contrib']
+    sums = _shared['sums']
+    for head in range(*bounds):
+        total = 0.0
+        for tail in indices[indptr[head]:indptr[head + 1]]:
+            total += contrib[tail]
+        sums[head] = total
+
+
+def _split(items: Sequence[int], parts: int) -> List[Sequence[int]]:
+    size = -(-len(items) // parts)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class ParallelEngine:
+    '''
+    Runs BFS and PageRank on a process pool
+
+    The graph is exported once into CSR arrays (offsets + concatenated neighbor
+    indices, in both directions) stored in multiprocessing.shared_memory,
+    so workers never pickle the graph; results are mapped back to the original nodes
+
+    With workers=1 everything runs in the current process; that's the serial
+    reference, and any number of workers produces identical results
+
+    Changes to the graph after the engine is created are not visible to it
+    Use as a context manager, or call close(), to release the pool and shared memory
+    '''
+
+    nodes: List[INode]
+
+    def __init__(self, g: IGraph, workers: Optional[int] = None,
+                 min_parallel: int = 1024) -> None:
+        '''
+        workers defaults to os.cpu_count()
+        frontiers (BFS) and node counts (PageRank) below min_parallel are processed in-process
+        '''
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self.nodes = list(g)
+        self._index = index = {node: i for i, node in enumerate(self.nodes)}
+
+        indptr = array('q', [0])
+        indices = array('q')
+        in_lists: List[List[int]] = [[] for _ in self.nodes]
+        for tail, node in enumerate(self.nodes):
+            for neighbor in node:
+                head = index[neighbor]
+                indices.append(head)
+                in_lists[head].append(tail)
+            indptr.append(len(indices))
+        in_indptr = array('q', [0])
+        in_indices = array('q')
+        for tails in in_lists:
+            in_indices.extend(tails)
+            in_indptr.append(len(in_indices))
+        self._out_degree = [indptr[i + 1] - indptr[i] for i in range(len(self.nodes))]
+
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._views: Dict[str, Any] = {}
+        self._create('indptr', indptr)
+        self._create('indices', indices)
+        self._create('in_indptr', in_indptr)
+        self._create('in_indices', in_indices)
+        self._create('dist', array('q', [-1]) * len(self.nodes))
+        self._create('contrib', array('d', [0.0]) * len(self.nodes))
+        self._create('sums', array('d', [0.0]) * len(self.nodes))
+        names = {key: segment.name for key, segment in self._segments.items()}
+
+        self._pool: Optional[Pool] = None
+        if self.workers > 1:
+            self._pool = multiprocessing.get_context().Pool(
+                self.workers, initializer=_attach, initargs=(names,))
+
+    def _create(self, key: str, data: 'array[Any]') -> None:
+        # zero-size segments are not allowed
+        segment = shared_memory.SharedMemory(create=True, size=max(len(data) * data.itemsize, 8))
+        cast(memoryview, segment.buf)[:len(data) * data.itemsize] = data.tobytes()
+        self._segments[key] = segment
+        self._views[key] = _view(segment, key)
+
+    def _map(self, func: Any, chunks: Sequence[Any]) -> List[Any]:
+        if self._pool is None or len(chunks) == 1:
+            return [func(chunk) for chunk in chunks]
+        return self._pool.map(func, chunks)
+
+    def bfs(self, source: INode) -> Dict[INode, int]:
+        '''
+        Returns the distance from source to every node reachable from it
+        '''
+        _shared.update(self._views)
+        dist = _shared['dist']
+        for i in range(len(self.nodes)):
+            dist[i] = -1
+        start = self._index[source]
+        dist[start] = 0
+        frontier = [start]
+        level = 0
+        while frontier:
+            level += 1
+            chunks: Sequence[Sequence[int]]
+            if self._pool is None or len(frontier) < self.min_parallel:
+                chunks = [frontier]
+            else:
+                chunks = _split(frontier, self.workers * 4)
+            next_frontier: List[int] = []
+            for unvisited in self._map(_expand, chunks):
+                for head in unvisited:
+                    if dist[head] < 0:
+                        dist[head] = level
+                        next_frontier.append(head)
+            frontier = next_frontier
+        return {node: dist[i] for i, node in enumerate(self.nodes) if dist[i] >= 0}
+
+    def pagerank(self, damping: float = 0.85, max_iterations: int = 100,
+                 tolerance: float = 1e-10) -> Dict[INode, float]:
+        '''
+        Power iteration; rank of nodes without outgoing edges is spread evenly over all nodes
+        Stops once the L1 change between iterations drops below tolerance
+        '''
+        n = len(self.nodes)
+        if n == 0:
+            return {}
+        _shared.update(self._views)
+        contrib, sums = _shared['contrib'], _shared['sums']
+        rank = [1 / n] * n
+        if self._pool is None or n < self.min_parallel:
+            ranges = [(0, n)]
+        else:
+            ranges = [(chunk.start, chunk.stop)  # type: ignore
+                      for chunk in _split(range(n), self.workers * 4)]
+        for _ in range(max_iterations):
+            dangling = 0.0
+            for i, degree in enumerate(self._out_degree):
+                if degree:
+                    contrib[i] = rank[i] / degree
+                else:
+                    contrib[i] = 0.0
+                    dangling += rank[i]
+            base = (1 - damping) / n + damping * dangling / n
+            self._map(_pull, ranges)
+            new_rank = [base + damping * total for total in sums]
+            change = sum(abs(new - old) for new, old in zip(new_rank, rank))
+            rank = new_rank
+            if change < tolerance:
+                break
+        return dict(zip(self.nodes, rank))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        for key, view in self._views.items():
+            if _shared.get(key) is view:
+                del _shared[key]
+            view.release()
+        self._views.clear()
+        for segment in self._segments.values():
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+
+    def __enter__(self) -> 'ParallelEngine':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def bfs_distances(source: INode) -> Dict[INode, int]:
+    dist = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbor in node:
+            if neighbor not in dist:
+                dist[neighbor] = dist[node] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def benchmark(n: int = 200000, m: int = 2000000, max_workers: Optional[int] = None) -> None:
+    '''
+    Prints BFS and PageRank wall time for 1, 2, 4, ... workers
+    '''
+    import random
+    import time
+
+    rng = random.Random(0)
+    g = Graph()
+    nodes = [g.add_node(i) for i in range(n)]
+    for _ in range(m):
+        g.add_edges(rng.choice(nodes), [rng.choice(nodes)])
+    source = next(iter(g))
+    max_workers = max_workers or os.cpu_count() or 1
+    workers = 1
+    reference: Optional[Tuple[Dict[INode, int], Dict[INode, float]]] = None
+    while workers <= max_workers:
+        with ParallelEngine(g, workers) as engine:
+            start = time.perf_counter()
+            dist = engine.bfs(source)
+            bfs_time = time.perf_counter() - start
+            start = time.perf_counter()
+            rank = engine.pagerank(max_iterations=20)
+            pagerank_time = time.perf_counter() - start
+        if reference is None:
+            reference = dist, rank
+        assert (dist, rank) == reference
+        print('{:3} workers: bfs {:.2f}s, pagerank {:.2f}s'.format(
+            workers, bfs_time, pagerank_time))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -1,21 +1,20 @@
 # module graph_reverse.py
 from typing import (
-    TypeVar, Generic, Set, List, Dict, Optional, DefaultDict, Iterator,
+    TypeVar, Generic, Set, List, Dict, Optional, DefaultDict, Iterable, Iterator,
     AbstractSet, Any
 )
-import pytest  # type: ignore
-from igraph import IGraphMutable, INode
-import graph
-from graph_functions import generic_tests
+from .igraph import IGraphMutable, INode
+from .ordered_set import OrderedSet
+from . import graph
 
 
 class Node(graph.Node):
     _adj: 'Set[Node]'  # type: ignore
     _back: 'Set[Node]'
 
-    def __init__(self, value: Any = None) -> None:
-        self._back = set()
-        super().__init__(value)
+    def __init__(self, value: Any = None, ordered: bool = False) -> None:
+        self._back = OrderedSet() if ordered else set()  # type: ignore
+        super().__init__(value, ordered)
 
     def back(self) -> 'Iterator[Node]':
         return iter(self._back)
@@ -25,8 +24,10 @@ class ReversibleGraph(graph.Graph):
     _nodes: Set[Node]  # type: ignore
 
     def add_node(self, value: Any = None) -> Node:
-        n = Node(value)
+        n = Node(value, self.ordered)
         self._nodes.add(n)
+        self._index_node(n)
+        self._version += 1
         return n
 
     def remove_node(self, node: Node) -> None:  # type: ignore
@@ -42,12 +43,13 @@ class ReversibleGraph(graph.Graph):
         head._back.add(tail)
         super().add_edge(tail, head)
 
+    def add_edges(self, tail: Node, heads: Iterable[Node]) -> None:  # type: ignore
+        heads = list(heads)
+        for head in heads:
+            head._back.add(tail)
+        super().add_edges(tail, heads)
+
     def remove_edge(self, tail: Node, head: Node) -> None:  # type: ignore
         # update _back adjacency sets
         head._back.remove(tail)
         super().remove_edge(tail, head)
-
-
-@pytest.mark.parametrize('test_func', generic_tests)
-def test_graph(test_func):  # type: ignore
-    test_func(ReversibleGraph)
@@ -0,0 +1,229 @@
+# module: graph_sharded.py
+from typing import (
+    Any, Callable, Dict, Iterator, List, Mapping, Optional, Set
+)
+from collections import Counter
+from itertools import chain, count
+import math
+from .igraph import IGraph, IGraphMutable, INode, InvalidOperation
+from .graph import Graph, Node
+from .graph_functions import write_graph
+
+
+# given a node key (0, 1, 2, ... in order of creation) and the number of shards,
+# returns the shard the node goes to
+Partition = Callable[[int, int], int]
+
+
+def hash_partition(key: int, shards: int) -> int:
+    return hash(key) % shards
+
+
+def range_partition(size: int) -> Partition:
+    '''
+    Puts the first size nodes into shard 0, the next size nodes into shard 1, and so on;
+    the last shard takes all the remaining nodes
+    '''
+    def partition(key: int, shards: int) -> int:
+        return min(key // size, shards - 1)
+    return partition
+
+
+class ShardNode(Node):
+    _adj: 'Set[ShardNode]'  # type: ignore
+    # index of the shard that owns this node and its outgoing edges
+    shard: int
+    # unique within the sharded graph, used as node id when serializing shards
+    key: int
+
+    def __init__(self, value: Any = None, shard: int = 0, key: int = 0) -> None:
+        super().__init__(value)
+        self.shard = shard
+        self.key = key
+
+
+class Shard(Graph):
+    '''
+    One partition of a ShardedGraph
+    Outgoing edges of its nodes may lead to nodes in other shards
+    Mutate it only through the ShardedGraph, so that the boundary table stays correct
+    With the degree index enabled, in_degrees only counts edges from nodes of this shard
+    '''
+    _nodes: Set[ShardNode]  # type: ignore
+
+    def __init__(self, index: int = 0) -> None:
+        super().__init__()
+        self.index = index
+        self._keys = count()
+
+    def add_node(self, value: Any = None, key: Optional[int] = None) -> ShardNode:
+        n = ShardNode(value, self.index, next(self._keys) if key is None else key)
+        self._nodes.add(n)
+        self._index_node(n)
+        self._version += 1
+        return n
+
+    def _index_edge(self, tail: ShardNode, head: ShardNode, delta: int) -> None:  # type: ignore
+        if head.shard == self.index:
+            super()._index_edge(tail, head, delta)
+            return
+        # the head is indexed by its own shard
+        assert self.out_degrees is not None
+        if delta > 0:
+            self.out_degrees.increment(tail)
+        else:
+            self.out_degrees.decrement(tail)
+
+
+class ShardedGraph(IGraphMutable):
+    '''
+    Directed graph whose nodes are split between several Shard graphs
+
+    Each edge is stored in the shard of its tail; edges whose head is in another
+    shard are also recorded in the boundary table, so removing a node only scans
+    its own shard plus its incoming cross-shard edges
+
+    Shards can be serialized independently with write_shard; the node ids are
+    global, so concatenating all the shards gives the whole graph in read_graph format
+    '''
+
+    shards: List[Shard]
+    # head -> tails of cross-shard edges leading to it
+    boundary: Dict[ShardNode, Set[ShardNode]]
+
+    def __init__(self, shards: int = 4, partition: Partition = hash_partition) -> None:
+        self.shards = [Shard(i) for i in range(shards)]
+        self.partition = partition
+        self.boundary = {}
+        self._keys = count()
+
+    @classmethod
+    def from_graph(cls, g: IGraph, shards: int = 4,
+                   assignment: Optional[Mapping[INode, int]] = None,
+                   partition: Partition = hash_partition) -> 'ShardedGraph':
+        '''
+        Copies g (values and edges) into a new sharded graph
+        assignment maps nodes of g to shards, e.g. the output of label_propagation_partition
+        if it's not provided, partition chooses the shards
+        '''
+        sharded = cls(shards, partition)
+        nodes = {node: sharded.add_node(node.value,
+                                        None if assignment is None else assignment[node])
+                 for node in g}
+        for node in g:
+            for neighbor in node:
+                sharded.add_edge(nodes[node], nodes[neighbor])
+        return sharded
+
+    def __iter__(self) -> Iterator[ShardNode]:
+        return chain.from_iterable(self.shards)  # type: ignore
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, ShardNode) or item.shard >= len(self.shards):
+            return False
+        return item in self.shards[item.shard]
+
+    def add_node(self, value: Any = None, shard: Optional[int] = None) -> ShardNode:
+        '''
+        Creates a new node in the specified shard, or in the shard chosen by partition
+        '''
+        key = next(self._keys)
+        if shard is None:
+            shard = self.partition(key, len(self.shards))
+        return self.shards[shard].add_node(value, key)
+
+    def remove_node(self, node: ShardNode) -> None:  # type: ignore
+        '''
+        Removes the specified node and all edges to and from it
+        Raises if node is not present
+        '''
+        shard = self.shards[node.shard]
+        if node not in shard:
+            raise KeyError(node)
+        for tail in self.boundary.pop(node, ()):
+            self.shards[tail.shard].remove_edge(tail, node)
+        for head in [head for head in node if head.shard != node.shard]:
+            shard.remove_edge(node, head)
+            self._remove_boundary(node, head)
+        shard.remove_node(node)
+
+    def add_edge(self, tail: ShardNode, head: ShardNode) -> None:  # type: ignore
+        '''
+        Adds the specified edge
+        Raises if it's already present
+        '''
+        self.shards[tail.shard].add_edge(tail, head)
+        if head.shard != tail.shard:
+            self.boundary.setdefault(head, set()).add(tail)
+
+    def remove_edge(self, tail: ShardNode, head: ShardNode) -> None:  # type: ignore
+        '''
+        Removes the specified edge
+        Raises if it's not present
+        '''
+        self.shards[tail.shard].remove_edge(tail, head)
+        if head.shard != tail.shard:
+            self._remove_boundary(tail, head)
+
+    def _remove_boundary(self, tail: ShardNode, head: ShardNode) -> None:
+        tails = self.boundary[head]
+        tails.remove(tail)
+        if not tails:
+            del self.boundary[head]
+
+    def edge_cut(self) -> int:
+        '''
+        Number of cross-shard edges
+        '''
+        return sum(len(tails) for tails in self.boundary.values())
+
+    def write_shard(self, index: int) -> str:
+        shard = self.shards[index]
+        ids = {node: node.key for node in chain(shard, *shard)}
+        return write_graph(shard, ids)
+
+    def __repr__(self) -> str:
+        return '<Graph with {} nodes>\nShard sizes: {}\nNodes: {}'.format(
+            len(self), [len(shard) for shard in self.shards], set(self))
+
+
+def label_propagation_partition(g: IGraph, shards: int, iterations: int = 10,
+                                slack: float = 0.1) -> Dict[INode, int]:
+    '''
+    Assigns nodes to shards so that few edges cross shards
+
+    Starts from a round-robin assignment, then repeatedly moves every node to the
+    shard most common among its neighbors (in either direction), as long as that
+    shard holds fewer than (1 + slack) * len(g) / shards nodes
+    Stops after the given number of iterations or when no node moves
+    '''
+    nodes = list(g)
+    neighbors: Dict[INode, List[INode]] = {node: [] for node in nodes}
+    for node in nodes:
+        for neighbor in node:
+            if neighbor is not node:
+                neighbors[node].append(neighbor)
+                neighbors[neighbor].append(node)
+
+    assignment = {node: i % shards for i, node in enumerate(nodes)}
+    sizes = Counter(assignment.values())
+    capacity = math.ceil((1 + slack) * len(nodes) / shards)
+    for _ in range(iterations):
+        moved = False
+        for node in nodes:
+            current = assignment[node]
+            votes = Counter(assignment[neighbor] for neighbor in neighbors[node])
+            if not votes:
+                continue
+            best = max(votes.items(), key=lambda item: (item[1], -item[0]))[0]
+            if votes[best] > votes[current] and sizes[best] < capacity:
+                assignment[node] = best
+                sizes[current] -= 1
+                sizes[best] += 1
+                moved = True
+        if not moved:
+            break
+    return assignment
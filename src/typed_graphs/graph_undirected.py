@@ -1,35 +1,87 @@
 # module graph_undirected.py
 from typing import (
-    TypeVar, Generic, Set, List, Dict, Optional, DefaultDict, Iterator,
-    AbstractSet, Any, ClassVar
+    TypeVar, Generic, Set, List, Dict, Optional, DefaultDict, Iterable, Iterator,
+    AbstractSet, Any, ClassVar, Tuple
 )
-import pytest  # type: ignore
-from igraph import IGraphMutable, INode, InvalidOperation, INodeMutable
-from graph import Graph, Node
-from graph_functions import generic_tests
+from .igraph import IGraphMutable, INode, InvalidOperation, INodeMutable
+from .graph import Graph, Node
+from .degree_index import DegreeIndex
 
 
 class UndirectedGraph(Graph):
+    '''
+    Edge {u, v} is stored as v in u's adjacency set and u in v's adjacency set;
+    iterating over a node's neighbors needs both entries, but everything else
+    touches each edge once: a single duplicate check on insert, and node removal
+    that only visits the node's own neighbors
+    '''
     allow_loops: ClassVar[bool] = False
 
+    def enable_degree_index(self) -> None:
+        '''
+        In- and out-degree are the same here, so in_degrees is out_degrees
+        '''
+        self.out_degrees = self.in_degrees = DegreeIndex()
+        for node in self._nodes:
+            self.out_degrees.add(node, len(node._adj))
+
+    def remove_node(self, node: Node) -> None:  # type: ignore
+        '''
+        Removes the specified node and all edges incident to it in O(degree)
+        Raises if node is not present
+        '''
+        assert isinstance(node, Node)
+        self._nodes.remove(node)
+        for neighbor in node._adj:
+            neighbor._adj.remove(node)
+        if self.out_degrees is not None:
+            for neighbor in node._adj:
+                self.out_degrees.decrement(neighbor)
+            self.out_degrees.remove(node)
+        self._version += 1
+
     def add_edge(self, tail: Node, head: Node) -> None:  # type: ignore
         if head is tail:
             raise InvalidOperation('Cannot create loops in UndirectedGraph')
-        super().add_edge(tail, head)
-        super().add_edge(head, tail)
+        if head in tail._adj:
+            raise InvalidOperation('Attempted to add a duplicate edge')
+        tail._adj.add(head)
+        head._adj.add(tail)
+        if self.out_degrees is not None:
+            self._index_edge(tail, head, 1)
+        self._version += 1
 
-    def remove_edge(self, tail: Node, head: Node) -> None:  # type: ignore
-        super().remove_edge(tail, head)
-        super().remove_edge(head, tail)
+    def add_edges(self, tail: Node, heads: Iterable[Node]) -> None:  # type: ignore
+        '''
+        Adds edges between tail and each of heads, skipping duplicates and loops
+        '''
+        indexed = self.out_degrees is not None
+        for head in heads:
+            if head is not tail:
+                if indexed and head in tail._adj:
+                    continue
+                tail._adj.add(head)
+                head._adj.add(tail)
+                if indexed:
+                    self._index_edge(tail, head, 1)
+        self._version += 1
 
+    def remove_edge(self, tail: Node, head: Node) -> None:  # type: ignore
+        tail._adj.remove(head)
+        head._adj.remove(tail)
+        if self.out_degrees is not None:
+            self._index_edge(tail, head, -1)
+        self._version += 1
 
-@pytest.mark.parametrize('test_func', generic_tests)
-def test_graph(test_func):  # type: ignore
-    test_func(UndirectedGraph)
-
+    def edges(self) -> Iterator[Tuple[Node, Node]]:
+        '''
+        Yields every edge exactly once, as a (node, neighbor) pair
+        '''
+        for node in self._nodes:
+            node_id = id(node)
+            for neighbor in node._adj:
+                if node_id < id(neighbor):
+                    yield node, neighbor
 
-def test_loop() -> None:
-    g = UndirectedGraph()
-    node = g.add_node()
-    with pytest.raises(InvalidOperation):
-        g.add_edge(node, node)
+    def edge_count(self) -> int:
+        return sum(len(node._adj) for node in self._nodes) // 2
@@ -1,5 +1,7 @@
 # module: igraph.py
-from typing import AbstractSet, Any, Set, Iterator, Collection, TypeVar, Generic, ClassVar
+from typing import (
+    AbstractSet, Any, Set, Iterable, Iterator, Collection, TypeVar, Generic, ClassVar
+)
 from abc import abstractmethod
 
 
@@ -48,3 +50,14 @@ class IGraphMutable(IGraph):
 
     @abstractmethod
     def remove_edge(self, tail: INodeMutable, head: INodeMutable) -> None: ...
+
+    def add_edges(self, tail: INodeMutable, heads: Iterable[INodeMutable]) -> None:
+        '''
+        Adds edges from tail to each of heads, skipping those that add_edge rejects
+        Implementations override it to insert edges in bulk
+        '''
+        for head in heads:
+            try:
+                self.add_edge(tail, head)
+            except InvalidOperation:
+                pass
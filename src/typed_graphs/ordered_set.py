@@ -0,0 +1,128 @@
+# module: ordered_set.py
+from typing import AbstractSet, Any, Dict, Hashable, Iterable, Iterator, List, MutableSet, TypeVar
+
+T = TypeVar('T', bound=Hashable)
+
+
+class OrderedSet(MutableSet[T]):
+    '''
+    Set that iterates in insertion order, stored as the keys of an internal dict
+
+    Membership, len and iteration go straight to the dict; the set operators,
+    comparisons and isdisjoint come from MutableSet and, as for set, ignore order
+    and are only defined against other sets (an OrderedSet never equals a dict)
+    Re-adding an element keeps its original position
+    '''
+    __slots__ = ('_items',)
+
+    _items: Dict[T, None]
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._items = dict.fromkeys(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: T) -> None:
+        self._items[item] = None
+
+    def remove(self, item: T) -> None:
+        del self._items[item]
+
+    def discard(self, item: T) -> None:
+        self._items.pop(item, None)
+
+    def pop(self) -> T:
+        '''
+        Removes and returns the most recently added element
+        Raises KeyError if the set is empty
+        '''
+        if not self._items:
+            raise KeyError('pop from an empty set')
+        return self._items.popitem()[0]
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def update(self, items: Iterable[T]) -> None:
+        self._items.update(dict.fromkeys(items))
+
+    def copy(self) -> 'OrderedSet[T]':
+        return OrderedSet(self._items)
+
+    def __and__(self, other: object) -> 'OrderedSet[T]':
+        # MutableSet's version iterates over other, which would lose the order of self
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        if not isinstance(other, AbstractSet):
+            other = set(other)
+        return OrderedSet(item for item in self._items if item in other)
+
+    __rand__ = __and__
+
+    def __repr__(self) -> str:
+        if not self:
+            return 'OrderedSet()'
+        return '{' + ', '.join(map(repr, self)) + '}'
+
+
+def benchmark(nodes: int = 100000, edges: int = 1000000, repeat: int = 3) -> None:
+    '''
+    Times building, traversing, serializing and tearing down the same random graph
+    with the default set storage and with ordered storage
+    '''
+    import random
+    import time
+    from functools import partial
+    from .graph import Graph, Node
+    from .graph_functions import write_graph
+    from .algorithms import bfs
+
+    rng = random.Random(0)
+    edge_list = [(rng.randrange(nodes), rng.randrange(nodes)) for _ in range(edges)]
+
+    def run(ordered: bool) -> Dict[str, float]:
+        timings: Dict[str, float] = {}
+
+        def timed(name: str, func: Any) -> Any:
+            start = time.perf_counter()
+            result = func()
+            timings[name] = min(timings.get(name, float('inf')), time.perf_counter() - start)
+            return result
+
+        def add_nodes(g: Graph) -> List[Node]:
+            return [g.add_node(i) for i in range(nodes)]
+
+        def add_edges(g: Graph, node_list: List[Node]) -> None:
+            for tail, head in edge_list:
+                if node_list[head] not in node_list[tail]:
+                    g.add_edge(node_list[tail], node_list[head])
+
+        def remove_edges(g: Graph, node_list: List[Node]) -> None:
+            for tail in node_list:
+                for head in list(tail._adj):
+                    g.remove_edge(tail, head)
+
+        for _ in range(repeat):
+            g = Graph(ordered=ordered)
+            node_list = timed('add_node', partial(add_nodes, g))
+            timed('add_edge', partial(add_edges, g, node_list))
+            timed('bfs', partial(bfs, g, node_list[0]))
+            timed('write_graph', partial(write_graph, g))
+            timed('remove_edge', partial(remove_edges, g, node_list))
+        return timings
+
+    default, ordered = run(False), run(True)
+    for name in default:
+        print('{:>12}: set {:.3f}s, ordered {:.3f}s, overhead {:+.0%}'.format(
+            name, default[name], ordered[name], ordered[name] / default[name] - 1))
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,182 @@
+# module: reachability.py
+from typing import Any, Dict, Iterable, List, Set, Tuple
+import sys
+from .graph import Graph, Node
+
+
+def strongly_connected_components(g: Graph) -> List[List[Node]]:
+    '''
+    Tarjan's algorithm, without recursion so that long paths don't hit the recursion limit
+    Components are returned in reverse topological order: if there's an edge
+    from component i to component j != i, then j < i
+    '''
+    index: Dict[Node, int] = {}
+    low: Dict[Node, int] = {}
+    stack: List[Node] = []
+    on_stack: Set[Node] = set()
+    components: List[List[Node]] = []
+
+    for root in g:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work: List[Tuple[Node, Any]] = [(root, iter(root))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(neighbor)))
+                    break
+                if neighbor in on_stack:
+                    low[node] = min(low[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component: List[Node] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member is node:
+                            break
+                    components.append(component)
+    return components
+
+
+class ReachabilityIndex:
+    '''
+    Answers "is there a path from tail to head" without searching the graph
+
+    The graph is condensed into strongly connected components, and every component
+    stores the set of components reachable from it as a bitset (a python int)
+    Building takes O(V + E) component merges of bitsets
+    With C components, a query tests one bit of a C-bit int, which shifts the whole int:
+    O(C / 30) time, and the bitsets take up to C^2 / 8 bytes; this is the fast choice
+    when many components reach each other, see SparseReachabilityIndex otherwise
+
+    Mutations should go through the index:
+    * add_node / add_edge update the bitsets incrementally
+    * remove_node / remove_edge mark the index stale; it's rebuilt on the next query
+    Mutations made directly on the graph are detected through graph.version,
+    and also cause a rebuild on the next query
+
+    Every node reaches itself
+    '''
+
+    _component: Dict[Node, int]
+    # _closure[i] contains component j iff component i reaches component j
+    _closure: List[Any]
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self._component = {}
+        self._closure = []
+        for component_id, component in enumerate(strongly_connected_components(self.graph)):
+            for node in component:
+                self._component[node] = component_id
+            bits = self._singleton(component_id)
+            for node in component:
+                for neighbor in node:
+                    # components reachable from this one were numbered (and computed) earlier
+                    neighbor_id = self._component[neighbor]
+                    if neighbor_id != component_id:
+                        bits = self._union(bits, self._closure[neighbor_id])
+            self._closure.append(bits)
+        self._stale = False
+        self._version = self.graph.version
+
+    # the closure representation; subclasses override these three together
+    @staticmethod
+    def _singleton(component_id: int) -> Any:
+        return 1 << component_id
+
+    @staticmethod
+    def _union(bits: Any, other: Any) -> Any:
+        return bits | other
+
+    @staticmethod
+    def _has(bits: Any, component_id: int) -> bool:
+        return bool(bits >> component_id & 1)
+
+    @property
+    def stale(self) -> bool:
+        return self._stale or self._version != self.graph.version
+
+    def reaches(self, tail: Node, head: Node) -> bool:
+        if self.stale:
+            self.rebuild()
+        return self._has(self._closure[self._component[tail]], self._component[head])
+
+    def add_node(self, value: Any = None) -> Node:
+        stale = self.stale
+        node = self.graph.add_node(value)
+        if not stale:
+            self._component[node] = len(self._closure)
+            self._closure.append(self._singleton(len(self._closure)))
+            self._version = self.graph.version
+        return node
+
+    def add_edge(self, tail: Node, head: Node) -> None:
+        stale = self.stale
+        self.graph.add_edge(tail, head)
+        if stale:
+            return
+        tail_id = self._component[tail]
+        head_closure = self._closure[self._component[head]]
+        if not self._has(self._closure[tail_id], self._component[head]):
+            # everything that reaches tail now reaches everything head reaches
+            # strongly connected components are not merged, which doesn't affect queries
+            for component_id, bits in enumerate(self._closure):
+                if self._has(bits, tail_id):
+                    self._closure[component_id] = self._union(bits, head_closure)
+        self._version = self.graph.version
+
+    def remove_edge(self, tail: Node, head: Node) -> None:
+        self.graph.remove_edge(tail, head)
+        self._stale = True
+
+    def remove_node(self, node: Node) -> None:
+        self.graph.remove_node(node)
+        self._stale = True
+
+    def memory_usage(self) -> int:
+        '''
+        Approximate number of bytes used by the index, not counting the graph itself
+        '''
+        closure_size = sum(sys.getsizeof(bits) for bits in self._closure)
+        return sys.getsizeof(self._component) + sys.getsizeof(self._closure) + closure_size
+
+
+class SparseReachabilityIndex(ReachabilityIndex):
+    '''
+    ReachabilityIndex that stores the components reachable from each component
+    as a set of ids instead of a bitset
+    Queries are O(1) hash lookups, and memory grows with the number of reachable
+    component pairs rather than with C^2, which is smaller when most components
+    reach few others; merging sets during the build is slower than or-ing ints
+    '''
+
+    @staticmethod
+    def _singleton(component_id: int) -> Any:
+        return {component_id}
+
+    @staticmethod
+    def _union(bits: Any, other: Any) -> Any:
+        # every component owns its set, so it can be updated in place
+        bits |= other
+        return bits
+
+    @staticmethod
+    def _has(bits: Any, component_id: int) -> bool:
+        return component_id in bits
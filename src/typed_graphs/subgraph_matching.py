@@ -0,0 +1,305 @@
+# module: subgraph_matching.py
+from typing import (
+    Any, Collection, Counter, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+)
+from collections import defaultdict
+import collections
+import time
+from .igraph import IGraph, INode
+from .graph_undirected import UndirectedGraph
+
+Match = Dict[INode, INode]
+
+# how many candidates are tried between two looks at the clock
+_TIMEOUT_CHECK_EVERY = 1024
+
+
+def _predecessors(g: IGraph) -> Dict[INode, Set[INode]]:
+    preds: Dict[INode, Set[INode]] = {node: set() for node in g}
+    for node in g:
+        for neighbor in node:
+            preds[neighbor].add(node)
+    return preds
+
+
+def _signature(neighbors: Iterable[INode]) -> Counter[Any]:
+    return collections.Counter(neighbor.value for neighbor in neighbors)
+
+
+def _covers(signature: Counter[Any], required: Counter[Any]) -> bool:
+    return all(signature[value] >= count for value, count in required.items())
+
+
+class SubgraphMatcher:
+    '''
+    Finds copies of a small pattern graph inside a large target graph, VF2 style:
+    pattern nodes are matched one at a time, and a partial match is extended
+    only with target nodes whose edges to already matched nodes agree with the pattern
+
+    A match maps every pattern node to a distinct target node with an equal value
+    (if match_values) so that every pattern edge tail -> head has a target edge
+    match[tail] -> match[head]; if induced, target edges between matched nodes
+    must also have a pattern counterpart
+    A pattern self-loop needs a target self-loop; if induced, a target self-loop
+    on a matched node needs a pattern one
+    Values have to be hashable when match_values is set
+
+    Candidates for a pattern node are pruned before the search by
+    * value, through an index of the target from value to nodes
+    * degree: out- and in-degree at least those of the pattern node
+    * neighbor-label signature: for every value, at least as many neighbors
+      (successors and predecessors separately) with that value as the pattern node
+    During the search, a pattern node connected to an already matched one only
+    tries the neighbors of that node's image
+
+    Pattern nodes are matched most constrained first: the node with the fewest
+    candidates, then repeatedly the node with most edges to those already ordered
+
+    If both graphs are UndirectedGraph, edges are matched without direction
+    The graphs must not be modified while matches are being generated
+    '''
+
+    _order: List[INode]
+    _candidates: List[Set[INode]]
+    # for every position in _order, earlier positions linked to it by an edge
+    # from (_out_links) or to (_in_links) that pattern node
+    _out_links: List[List[int]]
+    _in_links: List[List[int]]
+    # an earlier position whose image's neighborhood is searched instead of all candidates,
+    # with True if the pattern node is a successor of it
+    _anchors: List[Optional[Tuple[int, bool]]]
+    # for every position in _order, whether that pattern node has a self-loop
+    _loops: List[bool]
+
+    def __init__(self, pattern: IGraph, target: IGraph, *,
+                 induced: bool = False, match_values: bool = True) -> None:
+        self.pattern = pattern
+        self.target = target
+        self.induced = induced
+        self.match_values = match_values
+        undirected = isinstance(pattern, UndirectedGraph) and isinstance(target, UndirectedGraph)
+        self.directed = not undirected
+        self.timed_out = False
+        self._target_preds = _predecessors(target) if self.directed else None
+        self._pattern_preds = _predecessors(pattern) if self.directed else None
+        self._value_index: Dict[Any, List[INode]] = defaultdict(list)
+        if match_values:
+            for node in target:
+                self._value_index[node.value].append(node)
+        candidates = {node: self._filter_candidates(node) for node in pattern}
+        self._order = self._matching_order(candidates)
+        self._candidates = [candidates[node] for node in self._order]
+        self._build_links()
+
+    def _filter_candidates(self, p: INode) -> Set[INode]:
+        if self.match_values:
+            pool: Iterable[INode] = self._value_index.get(p.value, ())
+        else:
+            pool = self.target
+        out_degree = len(p)
+        out_signature = _signature(p) if self.match_values else None
+        in_degree = 0
+        in_signature = None
+        if self._pattern_preds is not None:
+            in_degree = len(self._pattern_preds[p])
+            in_signature = _signature(self._pattern_preds[p]) if self.match_values else None
+
+        result: Set[INode] = set()
+        for t in pool:
+            if len(t) < out_degree:
+                continue
+            if self._target_preds is not None and len(self._target_preds[t]) < in_degree:
+                continue
+            if out_signature and not _covers(_signature(t), out_signature):
+                continue
+            if in_signature and self._target_preds is not None:
+                if not _covers(_signature(self._target_preds[t]), in_signature):
+                    continue
+            result.add(t)
+        return result
+
+    def _linked(self, a: INode, b: INode) -> bool:
+        return b in a or a in b
+
+    def _matching_order(self, candidates: Dict[INode, Set[INode]]) -> List[INode]:
+        remaining = set(self.pattern)
+        order: List[INode] = []
+        # number of edges from each remaining node to the ordered ones
+        connections = dict.fromkeys(remaining, 0)
+        while remaining:
+            node = max(remaining, key=lambda n: (connections[n], -len(candidates[n])))
+            remaining.remove(node)
+            order.append(node)
+            for other in remaining:
+                if self._linked(node, other):
+                    connections[other] += 1
+        return order
+
+    def _build_links(self) -> None:
+        self._out_links, self._in_links, self._anchors = [], [], []
+        self._loops = [p in p for p in self._order]
+        for i, p in enumerate(self._order):
+            out_links = [j for j in range(i) if self._order[j] in p]
+            in_links = [j for j in range(i) if p in self._order[j]] if self.directed else []
+            self._out_links.append(out_links)
+            self._in_links.append(in_links)
+            if in_links:
+                self._anchors.append((in_links[0], True))
+            elif out_links:
+                self._anchors.append((out_links[0], False))
+            else:
+                self._anchors.append(None)
+
+    def _candidates_at(self, depth: int, mapping: List[Any]) -> Iterator[INode]:
+        candidates = self._candidates[depth]
+        anchor = self._anchors[depth]
+        if anchor is None:
+            return iter(candidates)
+        j, successor = anchor
+        image = mapping[j]
+        if successor:
+            neighbors: Collection[INode] = image
+        else:
+            neighbors = self._target_preds[image] if self._target_preds is not None else image
+        if len(neighbors) < len(candidates):
+            return (t for t in neighbors if t in candidates)
+        return (t for t in candidates if t in neighbors)
+
+    def _feasible(self, depth: int, t: INode, mapping: List[Any]) -> bool:
+        if self._loops[depth]:
+            if t not in t:
+                return False
+        elif self.induced and t in t:
+            return False
+        out_links = self._out_links[depth]
+        in_links = self._in_links[depth]
+        for j in out_links:
+            if mapping[j] not in t:
+                return False
+        for j in in_links:
+            if t not in mapping[j]:
+                return False
+        if self.induced:
+            for j in range(depth):
+                if j not in out_links and mapping[j] in t:
+                    return False
+                if self.directed and j not in in_links and t in mapping[j]:
+                    return False
+        return True
+
+    def matches(self, limit: Optional[int] = None,
+                timeout: Optional[float] = None) -> Iterator[Match]:
+        '''
+        Yields matches (dicts from pattern nodes to target nodes) as they are found
+        Stops after limit matches, or once timeout seconds have passed since the first
+        next() call; in the latter case timed_out is set
+        '''
+        self.timed_out = False
+        n = len(self._order)
+        if n == 0 or limit == 0:
+            return
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        mapping: List[Any] = [None] * n
+        used: Set[INode] = set()
+        stack = [self._candidates_at(0, mapping)]
+        found = 0
+        steps = 0
+        while stack:
+            depth = len(stack) - 1
+            if mapping[depth] is not None:
+                used.remove(mapping[depth])
+                mapping[depth] = None
+            for t in stack[-1]:
+                steps += 1
+                if steps % _TIMEOUT_CHECK_EVERY == 0 and deadline is not None:
+                    if time.monotonic() > deadline:
+                        self.timed_out = True
+                        return
+                if t in used or not self._feasible(depth, t, mapping):
+                    continue
+                if depth + 1 == n:
+                    mapping[depth] = t
+                    yield dict(zip(self._order, mapping))
+                    mapping[depth] = None
+                    found += 1
+                    if found == limit:
+                        return
+                    continue
+                mapping[depth] = t
+                used.add(t)
+                stack.append(self._candidates_at(depth + 1, mapping))
+                break
+            else:
+                stack.pop()
+
+    def __iter__(self) -> Iterator[Match]:
+        return self.matches()
+
+
+def find_matches(pattern: IGraph, target: IGraph, *, induced: bool = False,
+                 match_values: bool = True, limit: Optional[int] = None,
+                 timeout: Optional[float] = None) -> Iterator[Match]:
+    '''
+    Shortcut for SubgraphMatcher(pattern, target, ...).matches(limit, timeout)
+    '''
+    matcher = SubgraphMatcher(pattern, target, induced=induced, match_values=match_values)
+    return matcher.matches(limit, timeout)
+
+
+def benchmark(nodes: int = 2000, edges: int = 8000, labels: int = 5, repeat: int = 3) -> None:
+    '''
+    Counts matches of a few motifs in a random labeled graph, and compares with plain
+    backtracking: every target node with the right value is a candidate, and every
+    pattern node tries all of its candidates
+    '''
+    import random
+    from .graph import Graph
+
+    def random_graph(cls: Any, rng: random.Random) -> Any:
+        g = cls()
+        node_list = [g.add_node(rng.randrange(labels)) for _ in range(nodes)]
+        for _ in range(edges):
+            g.add_edges(rng.choice(node_list), [rng.choice(node_list)])
+        return g
+
+    def motif(cls: Any, values: List[int], edge_list: List[Tuple[int, int]]) -> Any:
+        g = cls()
+        node_list = [g.add_node(value) for value in values]
+        for tail, head in edge_list:
+            g.add_edge(node_list[tail], node_list[head])
+        return g
+
+    rng = random.Random(0)
+    cases = []
+    for cls in [Graph, UndirectedGraph]:
+        target = random_graph(cls, rng)
+        cases += [
+            (cls.__name__ + ' triangle', target, motif(cls, [0, 1, 2], [(0, 1), (1, 2), (2, 0)])),
+            (cls.__name__ + ' path', target, motif(cls, [0, 1, 2, 3], [(0, 1), (1, 2), (2, 3)])),
+            (cls.__name__ + ' fan-out', target,
+             motif(cls, [0, 1, 1, 1], [(0, 1), (0, 2), (0, 3)])),
+        ]
+
+    for name, target, pattern in cases:
+        timings = []
+        counts = []
+        for prune in [False, True]:
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                matcher = SubgraphMatcher(pattern, target)
+                if not prune:
+                    matcher._candidates = [set(matcher._value_index[p.value])
+                                           for p in matcher._order]
+                    matcher._anchors = [None] * len(matcher._order)
+                count = sum(1 for _ in matcher.matches())
+                best = min(best, time.perf_counter() - start)
+            timings.append(best)
+            counts.append(count)
+        assert counts[0] == counts[1]
+        print('{:>26}: {:>7} matches, unpruned {:.3f}s, pruned {:.3f}s, speedup {:.1f}x'.format(
+            name, counts[1], timings[0], timings[1], timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,98 @@
+from typing import Any, Dict, Set
+import pytest  # type: ignore
+from typed_graphs import dictgraph, dictgraph_nodeclass, dictgraph_nodegeneric, setgraph_nodeclass
+from typed_graphs import graph_generic
+from typed_graphs.algorithms import bfs, neighbors, reachable, topological_sort
+from typed_graphs.dictgraph_interned import InternedGraph, InternedReverseGraph
+from typed_graphs.dictgraph_interned import read_graph as read_interned_graph
+from typed_graphs.dictgraph_reverse_nodegeneric import read_graph as read_reverse_graph
+from typed_graphs.graph import Graph
+from typed_graphs.graph_multi import MultiGraph
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_sharded import ShardedGraph
+from typed_graphs.graph_undirected import UndirectedGraph
+
+# A -> B -> D, A -> C -> D, E isolated
+EDGES = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]
+
+
+def build(cls: Any) -> Any:
+    g = cls()
+    nodes = {value: g.add_node(value) for value in 'ABCDE'}
+    for tail, head in EDGES:
+        g.add_edge(nodes[tail], nodes[head])
+    return g, nodes
+
+
+def values(result: Any) -> Any:
+    if isinstance(result, dict):
+        return {node.value: dist for node, dist in result.items()}
+    if isinstance(result, set):
+        return {node.value for node in result}
+    return [node.value for node in result]
+
+
+@pytest.mark.parametrize('cls', [Graph, ReversibleGraph, MultiGraph, ShardedGraph,
+                                 graph_generic.Graph])
+def test_node_graphs(cls):  # type: ignore
+    g, nodes = build(cls)
+    assert neighbors(g)(nodes['A']) == nodes['A']._adj
+    assert values(bfs(g, nodes['A'])) == {'A': 0, 'B': 1, 'C': 1, 'D': 2}
+    assert values(reachable(g, nodes['B'])) == {'B', 'D'}
+    order = values(topological_sort(g))
+    assert sorted(order) == list('ABCDE')
+    assert all(order.index(tail) < order.index(head) for tail, head in EDGES)
+
+    # the generic INode protocol path gives the same answers
+    if cls is not graph_generic.Graph:
+        assert bfs(g, nodes['A'], iter) == bfs(g, nodes['A'])
+
+
+def test_undirected() -> None:
+    g, nodes = build(UndirectedGraph)
+    assert values(bfs(g, nodes['D'])) == {'A': 2, 'B': 1, 'C': 1, 'D': 0}
+    with pytest.raises(ValueError):
+        topological_sort(g)
+
+
+def test_dict_graphs() -> None:
+    g_str = '''A B C
+    B D
+    C D
+    D
+    E'''
+    for g in [dictgraph_nodegeneric.read_graph(g_str, str),
+              InternedGraph()]:
+        if isinstance(g, InternedGraph):
+            for value in 'ABCDE':
+                g.add_node(value)
+            for tail, head in EDGES:
+                g.add_edge(tail, head)
+        assert bfs(g, 'A') == {'A': 0, 'B': 1, 'C': 1, 'D': 2}
+        assert reachable(g, 'C') == {'C', 'D'}
+        order = topological_sort(g)
+        assert all(order.index(tail) < order.index(head) for tail, head in EDGES)
+
+    int_graph: Dict[int, Set[int]] = {0: {1, 2}, 1: {3}, 2: {3}, 3: set(), 4: set()}
+    assert bfs(int_graph, 0) == {0: 0, 1: 1, 2: 1, 3: 2}
+
+    reverse = read_reverse_graph(g_str, str)
+    assert reachable(reverse, 'B', lambda node: reverse[node].forward) == {'B', 'D'}
+    assert reachable(reverse, 'D', lambda node: reverse[node].backward) == {'A', 'B', 'C', 'D'}
+    # without successors, the Adjacency values are followed forward
+    assert bfs(reverse, 'A') == {'A': 0, 'B': 1, 'C': 1, 'D': 2}
+    interned_reverse = read_interned_graph(g_str, str, InternedReverseGraph)
+    assert bfs(interned_reverse, 'A') == {'A': 0, 'B': 1, 'C': 1, 'D': 2}
+
+
+def test_node_class_graphs() -> None:
+    g_str = '''0 A 1 2
+    1 B 3
+    2 C 3
+    3 D
+    4 E'''
+    for module in [dictgraph_nodeclass, setgraph_nodeclass]:
+        g = module.read_graph(g_str, str)  # type: ignore
+        source = next(node for node in g if node.value == 'A')
+        assert values(bfs(g, source)) == {'A': 0, 'B': 1, 'C': 1, 'D': 2}
+        assert len(topological_sort(g)) == 5
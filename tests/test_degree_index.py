@@ -0,0 +1,82 @@
+from typing import Any, Dict
+import random
+import pytest  # type: ignore
+from typed_graphs.igraph import InvalidOperation
+from typed_graphs.graph import Graph
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_undirected import UndirectedGraph
+from typed_graphs.degree_index import DegreeIndex
+
+
+def test_degree_index() -> None:
+    index: DegreeIndex[str] = DegreeIndex()
+    with pytest.raises(ValueError):
+        index.max_degree()
+    index.add('a')
+    index.add('b', 3)
+    index.add('c', 3)
+    with pytest.raises(KeyError):
+        index.add('a')
+    assert (index.min_degree(), index.max_degree()) == (0, 3)
+    assert index.histogram() == {0: 1, 3: 2}
+    index.increment('a')
+    index.decrement('b')
+    index.decrement('b')
+    assert index.top(1) == ['c']
+    assert index.top(5) == ['c', 'b', 'a'] or index.top(5) == ['c', 'a', 'b']
+    assert index.nodes_with_degree(1) == {'a', 'b'}
+    index.remove('c')
+    assert (index.min_degree(), index.max_degree()) == (1, 1)
+    assert len(index) == 2 and 'c' not in index
+
+
+def check_index(g: Graph) -> None:
+    assert g.out_degrees is not None and g.in_degrees is not None
+    in_degree: Dict[Any, int] = {node: 0 for node in g}
+    for node in g:
+        for neighbor in node:
+            in_degree[neighbor] += 1
+    for node in g:
+        assert g.out_degrees.degree(node) == len(node)
+        assert g.in_degrees.degree(node) == in_degree[node]
+    assert len(g.out_degrees) == len(g.in_degrees) == len(g)
+    if len(g):
+        assert g.out_degrees.max_degree() == max(len(node) for node in g)
+        assert g.in_degrees.min_degree() == min(in_degree.values())
+        assert len(g.out_degrees.top(3)[0]) == g.out_degrees.max_degree()
+
+
+@pytest.mark.parametrize('cls', [Graph, ReversibleGraph, UndirectedGraph])
+def test_graph_degree_index(cls):  # type: ignore
+    rng = random.Random(0)
+    g = cls()
+    assert g.out_degrees is None
+    nodes = [g.add_node(i) for i in range(20)]
+    for _ in range(30):
+        try:
+            g.add_edge(rng.choice(nodes), rng.choice(nodes))
+        except InvalidOperation:
+            pass
+    g.enable_degree_index()
+    check_index(g)
+    for step in range(300):
+        action = rng.randrange(5)
+        if action == 0:
+            nodes.append(g.add_node(step))
+        elif action == 1 and len(nodes) > 1:
+            g.remove_node(nodes.pop(rng.randrange(len(nodes))))
+        elif action == 2:
+            g.add_edges(rng.choice(nodes), rng.sample(nodes, 3))
+        else:
+            tail, head = rng.choice(nodes), rng.choice(nodes)
+            if head in tail:
+                g.remove_edge(tail, head)
+            else:
+                try:
+                    g.add_edge(tail, head)
+                except InvalidOperation:
+                    pass  # loop in UndirectedGraph
+        check_index(g)
+    hist = g.out_degrees.histogram()
+    assert sum(hist.values()) == len(g)
+    assert list(hist) == sorted(hist)
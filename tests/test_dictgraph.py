@@ -0,0 +1,12 @@
+from typed_graphs.dictgraph import Graph, read_graph, write_graph
+
+
+def test_serialization() -> None:
+    graph: Graph = {0: {0, 1, 2}, 1: set(), 2: {1}, 3: set()}
+    g_str = '''0 0 1 2
+    1
+    2 1
+    3'''
+
+    assert read_graph(g_str) == graph
+    assert read_graph(write_graph(graph)) == graph
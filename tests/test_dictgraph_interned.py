@@ -0,0 +1,51 @@
+import pytest  # type: ignore
+from typed_graphs import dictgraph_nodegeneric
+from typed_graphs.dictgraph_interned import (
+    InternedAdjacency, InternedReverseGraph, add_edge, read_graph, remove_edge, write_graph
+)
+
+
+def test_interned_graph() -> None:
+    graph = {'A': {'A', 'B', 'C'}, 'B': set(), 'C': {'B'}, 'D': set()}
+    g_str = '''A A B C
+    B
+    C B
+    D'''
+
+    g = read_graph(g_str, str)
+    assert g == graph
+    assert read_graph(write_graph(g), str) == graph
+    assert dictgraph_nodegeneric.read_graph(write_graph(g), str) == graph
+    assert 'A' in g['A'] and 'D' not in g['A'] and 'Z' not in g['A']
+    assert len(g['A']) == 3
+
+    # equal labels built separately end up as a single object
+    labels = {id(label) for neighbors in g.values() for label in neighbors}
+    assert len(labels) == len({label for neighbors in g.values() for label in neighbors})
+
+    remove_edge(g, 'A', 'B')
+    assert g['A'] == {'A', 'C'}
+    add_edge(g, 'D', 'E')
+    assert g['D'] == {'E'}
+    # as in dictgraph_nodegeneric, a label that is only a neighbor is not a key
+    assert 'E' not in g and len(g) == 4 and list(g) == ['A', 'B', 'C', 'D']
+    with pytest.raises(KeyError):
+        g['E']
+    assert read_graph('A B', str) == dictgraph_nodegeneric.read_graph('A B', str) == {'A': {'B'}}
+
+
+def test_interned_reverse_graph() -> None:
+    g_str = '''A A B C
+    B
+    C B
+    D'''
+    g = read_graph(g_str, str, InternedReverseGraph)
+    assert g['A'].forward == {'A', 'B', 'C'} and g['A'].backward == {'A'}
+    assert g['B'].forward == set() and g['B'].backward == {'A', 'C'}
+    assert g['D'] == InternedAdjacency(set(), set())
+    assert 'B' in read_graph('A B', str, InternedReverseGraph)
+    assert read_graph(write_graph(g), str, InternedReverseGraph)['C'] == g['C']
+
+    remove_edge(g, 'A', 'B')
+    assert g['A'].forward == {'A', 'C'}
+    assert g['B'].backward == {'C'}
@@ -0,0 +1,14 @@
+from typed_graphs.dictgraph_nodegeneric import Graph, read_graph, write_graph
+
+
+def test_serialization() -> None:
+    graph: Graph[str] = {'A': {'A', 'B', 'C'}, 'B': set(),
+                         'C': {'B'}, 'D': set()}
+
+    g_str = '''A A B C
+    B
+    C B
+    D'''
+
+    assert read_graph(g_str, str) == graph
+    assert read_graph(write_graph(graph), str) == graph
@@ -0,0 +1,8 @@
+import pytest  # type: ignore
+from typed_graphs.graph import Graph
+from generic import generic_tests
+
+
+@pytest.mark.parametrize('test_func', generic_tests)
+def test_graph(test_func):  # type: ignore
+    test_func(Graph)
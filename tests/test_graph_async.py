@@ -0,0 +1,76 @@
+from typing import Any, AsyncIterator, Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import pytest  # type: ignore
+from typed_graphs.igraph import INode
+from typed_graphs.graph import Graph
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_undirected import UndirectedGraph
+from typed_graphs.graph_functions import labeled_graph_eq, write_graph
+from typed_graphs.graph_async import bfs_async, dfs_async, read_graph_async
+from generic import get_test_graph, get_test_serialized_graph
+
+
+async def aiter_lines(lines: Iterable[Any]) -> AsyncIterator[Any]:
+    for line in lines:
+        yield line
+
+
+@pytest.fixture(params=[False, True], ids=['no executor', 'thread executor'])
+def executor(request):  # type: ignore
+    if not request.param:
+        yield None
+        return
+    with ThreadPoolExecutor(1) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize('cls', [Graph, ReversibleGraph, UndirectedGraph])
+def test_read_graph_async(cls, executor):  # type: ignore
+    g = get_test_graph(cls)
+    for lines in [get_test_serialized_graph(g.allow_loops),
+                  write_graph(g).splitlines(keepends=True),
+                  [line.encode() for line in write_graph(g).splitlines()]]:
+        coro = read_graph_async(cls, aiter_lines(lines), str, yield_every=2, executor=executor)
+        assert labeled_graph_eq(asyncio.run(coro), g)
+
+
+def test_read_graph_async_yields() -> None:
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main() -> Graph:
+        task = asyncio.ensure_future(ticker())
+        lines = ['{} {} {}\n'.format(i, i, i + 1) for i in range(100)]
+        g = await read_graph_async(Graph, aiter_lines(lines), int, yield_every=10)
+        task.cancel()
+        return g
+
+    g = asyncio.run(main())
+    assert len(g) == 101
+    assert ticks >= 10
+
+
+def test_traversal_async() -> None:
+    g = Graph()
+    a, b, c, d, e = (g.add_node(value) for value in 'ABCDE')
+    g.add_edge(a, b)
+    g.add_edge(a, c)
+    g.add_edge(b, d)
+    g.add_edge(d, a)
+
+    async def collect(it: AsyncIterator[INode]) -> List[Any]:
+        return [node.value async for node in it]
+
+    order = asyncio.run(collect(bfs_async(a, yield_every=1)))
+    assert order[0] == 'A' and set(order[1:3]) == {'B', 'C'} and order[3] == 'D'
+    order = asyncio.run(collect(dfs_async(a, yield_every=1)))
+    assert order[0] == 'A' and sorted(order) == ['A', 'B', 'C', 'D']
+    if order[1] == 'B':
+        assert order[2] == 'D'
+    assert asyncio.run(collect(bfs_async(e))) == ['E']
@@ -0,0 +1,85 @@
+from typing import Dict
+import pytest  # type: ignore
+from typed_graphs.graph import Graph, Node
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_cache import GraphCache
+
+
+def reachable(g: Graph, source: Node) -> Dict[Node, None]:
+    # used in tests below; returns an insertion-ordered set of nodes reachable from source
+    seen = {source: None}
+    stack = [source]
+    while stack:
+        for neighbor in stack.pop():
+            if neighbor not in seen:
+                seen[neighbor] = None
+                stack.append(neighbor)
+    return seen
+
+
+@pytest.mark.parametrize('cls', [Graph, ReversibleGraph])
+def test_cache_invalidation(cls):  # type: ignore
+    g = cls()
+    a = g.add_node('A')
+    b = g.add_node('B')
+    c = g.add_node('C')
+    g.add_edge(a, b)
+    cache = GraphCache(g)
+
+    assert set(cache(reachable, a)) == {a, b}
+    assert set(cache(reachable, a)) == {a, b}
+    assert cache.info()[:2] == (1, 1)
+
+    g.add_edge(b, c)
+    assert set(cache(reachable, a)) == {a, b, c}
+    g.remove_edge(a, b)
+    assert set(cache(reachable, a)) == {a}
+    d = g.add_node('D')
+    assert set(cache(reachable, d)) == {d}
+    g.remove_node(c)
+    assert set(cache(reachable, b)) == {b}
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.invalidations) == (1, 5, 4)
+    assert info.hit_rate == pytest.approx(1 / 6)
+
+
+def test_cache_eviction() -> None:
+    g = Graph()
+    nodes = [g.add_node(i) for i in range(4)]
+    cache = GraphCache(g, maxsize=2)
+    calls = []
+
+    @cache.cached
+    def degree(g: Graph, node: Node) -> int:
+        calls.append(node.value)
+        return len(node)
+
+    degree(nodes[0])
+    degree(nodes[1])
+    degree(nodes[0])  # nodes[1] is now least recently used
+    degree(nodes[2])
+    degree(nodes[0])
+    degree(nodes[1])
+    assert calls == [0, 1, 2, 1]
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (2, 4, 2, 2)
+
+    cache.clear()
+    assert cache.info().size == 0
+
+    with pytest.raises(ValueError):
+        GraphCache(g, maxsize=0)
+
+
+def test_cache_mutating_algorithm() -> None:
+    g = Graph()
+    cache = GraphCache(g)
+
+    def grow(g: Graph) -> int:
+        g.add_node()
+        return len(g)
+
+    assert cache(grow) == 1
+    assert cache(grow) == 2
+    assert cache.info().size == 0
@@ -0,0 +1,28 @@
+from io import StringIO
+import gc
+from typed_graphs.graph import Graph
+from typed_graphs.graph_functions import gc_paused, labeled_graph_eq, read_graph, write_graph
+from generic import get_test_graph
+
+
+def test_gc_paused() -> None:
+    assert gc.isenabled()
+    with gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+    with gc_paused(False):
+        assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_read_graph_pause_gc() -> None:
+    g = get_test_graph(Graph)
+    assert labeled_graph_eq(read_graph(Graph, StringIO(write_graph(g)), str, pause_gc=True), g)
+    assert gc.isenabled()
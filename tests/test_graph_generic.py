@@ -0,0 +1,64 @@
+from io import StringIO
+import re
+import pytest  # type: ignore
+from typed_graphs.graph_generic import (
+    Graph, InvalidOperation, labeled_graph_eq, read_graph, write_graph
+)
+
+
+def get_test_graph() -> Graph[str]:
+    g = Graph[str]()
+    a = g.add_node('A')
+    b = g.add_node('B')
+    c = g.add_node('C')
+    g.add_node('D')
+    g.add_edge(a, a)
+    g.add_edge(a, b)
+    g.add_edge(a, c)
+    g.add_edge(c, b)
+    return g
+
+
+def test_basic_functions() -> None:
+    g = Graph[str]()
+    v = g.add_node()
+    w = g.add_node()
+    g.add_edge(v, w)
+    with pytest.raises(InvalidOperation):
+        g.add_edge(v, w)
+
+    g = get_test_graph()
+    assert str(g).startswith('<Graph with 4 nodes>\n')
+
+    node_str = {re.sub(r' at \d+', '', str(node)) for node in g.nodes}
+    assert node_str == {'<Node A>', '<Node B>', '<Node C>', '<Node D>'}
+    for v in list(g.nodes):  # need list(), otherwise set changes during iteration
+        g.remove_node(v)
+    assert len(g.nodes) == 0
+
+    g = get_test_graph()
+    for v in g.nodes:
+        for w in list(v):
+            g.remove_edge(v, w)
+    for v in g.nodes:
+        assert len(list(v)) == 0
+
+
+def test_labeled_eq() -> None:
+    g1 = get_test_graph()
+    g2 = get_test_graph()
+    assert labeled_graph_eq(g1, g2)
+
+    next(iter(g1.nodes)).value = 'Z'
+    assert not labeled_graph_eq(g1, g2)
+
+
+def test_serialization() -> None:
+    g = get_test_graph()
+
+    g_str = StringIO('''0 A 0 1 2
+    1 B
+    2 C 1
+    3 D''')
+    assert labeled_graph_eq(read_graph(g_str, str), g)
+    assert labeled_graph_eq(read_graph(StringIO(write_graph(g)), str), g)
@@ -0,0 +1,80 @@
+from typing import List, Tuple
+from io import StringIO
+import pytest  # type: ignore
+from typed_graphs.graph_functions import labeled_graph_eq, read_graph
+from typed_graphs.graph_multi import MultiGraph, MultiNode, read_multigraph, write_multigraph
+from generic import generic_test_labeled_eq, generic_test_serialization
+
+
+# MultiGraph accepts duplicate edges, so generic_test_basic_functions doesn't apply
+@pytest.mark.parametrize('test_func', [generic_test_labeled_eq, generic_test_serialization])
+def test_graph(test_func):  # type: ignore
+    test_func(MultiGraph)
+
+
+def get_test_multigraph() -> Tuple[MultiGraph, List[MultiNode]]:
+    g = MultiGraph({'time': 'd', 'count': 'q'})
+    a, b, c = nodes = [g.add_node(value) for value in 'ABC']
+    g.add_edge(a, b, time=1.5, count=2)
+    g.add_edge(a, b, time=2.5, count=3)
+    g.add_edge(a, b, count=1)
+    g.add_edge(b, c, time=0.5)
+    g.add_edge(c, c, count=7)
+    return g, nodes
+
+
+def test_parallel_edges() -> None:
+    g, (a, b, c) = get_test_multigraph()
+    assert g.edge_count() == 5
+    assert g.edge_count(a, b) == 3 and g.edge_count(b, a) == 0
+    assert g.edge_count(tail=a) == 3 and g.edge_count(head=c) == 2
+    assert MultiGraph().edge_count() == 0
+    assert set(a) == {b} and len(a) == 1
+    assert g.aggregate(a, b, 'count') == 6
+    assert g.aggregate(a, b, 'time', max) == 2.5
+    assert {(t.value, h.value, n) for t, h, n in g.parallel_edge_counts()} == {
+        ('A', 'B', 3), ('B', 'C', 1), ('C', 'C', 1)}
+    with pytest.raises(KeyError):
+        g.add_edge(a, c, weight=1)
+
+    g.remove_edge(a, b)
+    assert g.edge_count(a, b) == 2
+    assert sorted(g.attributes(i)['count'] for i in g.edge_ids(a, b)) == [2, 3]
+    # every stored id still points at the right edge after ids were moved around
+    for tail, head, edge_id in g.edges():
+        assert edge_id in tail._adj[head] and edge_id in head._back[tail]
+
+    g.remove_node(c)
+    assert g.edge_count() == 2
+    assert set(b) == set()
+    g.remove_node(a)
+    assert g.edge_count() == 0
+    assert all(len(column) == 0 for column in g.columns.values())
+    with pytest.raises(KeyError):
+        g.remove_edge(a, b)
+
+
+def test_multigraph_serialization() -> None:
+    g, _ = get_test_multigraph()
+    g2 = read_multigraph(StringIO(write_multigraph(g)), str, {'time': 'd', 'count': 'q'})
+    assert labeled_graph_eq(g, g2)
+    assert sorted((t.value, h.value, tuple(sorted(g.attributes(i).items())))
+                  for t, h, i in g.edges()) == \
+        sorted((t.value, h.value, tuple(sorted(g2.attributes(i).items())))
+               for t, h, i in g2.edges())
+
+    g3 = read_multigraph(StringIO('0 A 1@count=4 1 1@time=2.0\n1 B'), str,
+                         {'time': 'd', 'count': 'q'})
+    a, b = sorted(g3, key=lambda node: node.value)
+    assert g3.edge_count(a, b) == 3
+    assert g3.aggregate(a, b, 'count') == 4 and g3.aggregate(a, b, 'time') == 2.0
+
+    # without attributes the format is the plain read_graph format
+    plain = MultiGraph()
+    x, y = plain.add_node('X'), plain.add_node('Y')
+    plain.add_edge(x, y)
+    plain.add_edge(x, y)
+    text = write_multigraph(plain)
+    lines = {line.split()[1]: line.split()[2:] for line in text.splitlines()}
+    assert len(lines['X']) == 2 and lines['Y'] == []
+    assert labeled_graph_eq(read_graph(MultiGraph, StringIO(text), str), plain)
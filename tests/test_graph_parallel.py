@@ -0,0 +1,53 @@
+import random
+import pytest  # type: ignore
+from typed_graphs.graph import Graph
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_parallel import ParallelEngine, bfs_distances
+
+
+def get_random_graph(n: int, m: int, seed: int) -> Graph:
+    rng = random.Random(seed)
+    g = Graph()
+    nodes = [g.add_node(i) for i in range(n)]
+    for _ in range(m):
+        g.add_edges(rng.choice(nodes), [rng.choice(nodes)])
+    return g
+
+
+@pytest.mark.parametrize('cls', [Graph, ReversibleGraph])
+def test_parallel_bfs(cls):  # type: ignore
+    g = cls()
+    nodes = [g.add_node(i) for i in range(6)]
+    for tail, head in [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 0)]:
+        g.add_edge(nodes[tail], nodes[head])
+    with ParallelEngine(g, workers=2, min_parallel=0) as engine:
+        assert engine.bfs(nodes[0]) == {nodes[0]: 0, nodes[1]: 1, nodes[2]: 1,
+                                        nodes[3]: 2, nodes[4]: 3}
+        assert engine.bfs(nodes[5]) == {nodes[5]: 0}
+
+
+def test_parallel_matches_serial() -> None:
+    g = get_random_graph(500, 2000, seed=1)
+    source = next(iter(g))
+    with ParallelEngine(g, workers=1) as engine:
+        dist = engine.bfs(source)
+        rank = engine.pagerank()
+    assert dist == bfs_distances(source)
+    assert sum(rank.values()) == pytest.approx(1)
+
+    with ParallelEngine(g, workers=3, min_parallel=0) as engine:
+        assert engine.bfs(source) == dist
+        assert engine.pagerank() == rank
+
+
+def test_pagerank_symmetric() -> None:
+    g = Graph()
+    a, b, c = (g.add_node(value) for value in 'ABC')
+    g.add_edge(a, b)
+    g.add_edge(b, c)
+    g.add_edge(c, a)
+    with ParallelEngine(g, workers=1) as engine:
+        rank = engine.pagerank()
+    assert all(value == pytest.approx(1 / 3) for value in rank.values())
+    with ParallelEngine(Graph()) as engine:
+        assert engine.pagerank() == {}
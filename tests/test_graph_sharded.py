@@ -0,0 +1,104 @@
+from io import StringIO
+import pytest  # type: ignore
+from typed_graphs.igraph import InvalidOperation
+from typed_graphs.graph import Graph
+from typed_graphs.graph_functions import labeled_graph_eq, read_graph
+from typed_graphs.graph_sharded import (
+    ShardedGraph, label_propagation_partition, range_partition
+)
+from generic import generic_tests
+
+
+@pytest.mark.parametrize('test_func', generic_tests)
+def test_graph(test_func):  # type: ignore
+    test_func(ShardedGraph)
+
+
+def test_boundary() -> None:
+    g = ShardedGraph(2, range_partition(2))
+    a, b, c, d = (g.add_node(value) for value in 'ABCD')
+    assert [node.shard for node in (a, b, c, d)] == [0, 0, 1, 1]
+    g.add_edge(a, b)
+    g.add_edge(a, c)
+    g.add_edge(d, a)
+    g.add_edge(c, d)
+    assert g.edge_cut() == 2
+    assert g.boundary == {c: {a}, a: {d}}
+    with pytest.raises(InvalidOperation):
+        g.add_edge(a, c)
+
+    g.remove_edge(a, c)
+    assert g.boundary == {a: {d}}
+    g.remove_node(a)
+    assert g.edge_cut() == 0
+    assert set(d) == set()
+    assert {node.value for node in g} == {'B', 'C', 'D'}
+    with pytest.raises(KeyError):
+        g.remove_node(a)
+
+
+def test_degree_index() -> None:
+    g = ShardedGraph(2, range_partition(2))
+    for shard in g.shards:
+        shard.enable_degree_index()
+    a, b, c, d = (g.add_node(value) for value in 'ABCD')
+    g.add_edges(a, [b, c])
+    g.add_edge(d, a)
+    g.add_edge(c, d)
+    shard0, shard1 = g.shards
+    assert shard0.out_degrees is not None and shard0.in_degrees is not None
+    assert shard1.out_degrees is not None and shard1.in_degrees is not None
+    assert [shard0.out_degrees.degree(node) for node in (a, b)] == [2, 0]
+    assert [shard1.out_degrees.degree(node) for node in (c, d)] == [1, 1]
+    # cross-shard edges are not counted by the head's shard
+    assert [shard0.in_degrees.degree(node) for node in (a, b)] == [0, 1]
+    assert [shard1.in_degrees.degree(node) for node in (c, d)] == [0, 1]
+
+    g.remove_node(a)
+    assert len(shard0.out_degrees) == len(shard0.in_degrees) == 1
+    assert shard1.out_degrees.degree(d) == 0
+
+
+def test_write_shard() -> None:
+    g = ShardedGraph(3)
+    nodes = [g.add_node(str(i)) for i in range(10)]
+    for i, node in enumerate(nodes):
+        g.add_edge(node, nodes[(i + 1) % 10])
+        g.add_edge(node, nodes[(i * 3) % 10 if (i * 3) % 10 != (i + 1) % 10 else 0])
+    shards = [g.write_shard(i) for i in range(3)]
+    assert labeled_graph_eq(read_graph(ShardedGraph, StringIO(''.join(shards)), str), g)
+
+    # a single shard reads as its own nodes, plus valueless placeholders for remote neighbors
+    local = read_graph(Graph, StringIO(shards[0]), str)
+    assert {node.value for node in local} - {None} == {node.value for node in g.shards[0]}
+
+
+def test_label_propagation() -> None:
+    # two dense clusters connected by a single edge
+    g = Graph()
+    clusters = [[g.add_node((c, i)) for i in range(6)] for c in range(2)]
+    for cluster in clusters:
+        for tail in cluster:
+            for head in cluster:
+                if tail is not head:
+                    g.add_edge(tail, head)
+    g.add_edge(clusters[0][0], clusters[1][0])
+
+    assignment = label_propagation_partition(g, 2)
+    sharded = ShardedGraph.from_graph(g, 2, assignment)
+    assert labeled_graph_eq(sharded, g)
+    assert sharded.edge_cut() == 1
+    assert sorted(len(shard) for shard in sharded.shards) == [6, 6]
+    assert ShardedGraph.from_graph(g, 2).edge_cut() > 1
+
+
+def test_from_graph_partition() -> None:
+    g = Graph(ordered=True)
+    nodes = [g.add_node(i) for i in range(6)]
+    for tail, head in zip(nodes, nodes[1:]):
+        g.add_edge(tail, head)
+    sharded = ShardedGraph.from_graph(g, 2, partition=range_partition(3))
+    assert labeled_graph_eq(sharded, g)
+    assert [sorted(node.value for node in shard) for shard in sharded.shards] == [
+        [0, 1, 2], [3, 4, 5]]
+    assert sharded.edge_cut() == 1
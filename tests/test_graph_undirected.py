@@ -0,0 +1,38 @@
+import pytest  # type: ignore
+from typed_graphs.igraph import InvalidOperation
+from typed_graphs.graph_undirected import UndirectedGraph
+from generic import generic_tests
+
+
+@pytest.mark.parametrize('test_func', generic_tests)
+def test_graph(test_func):  # type: ignore
+    test_func(UndirectedGraph)
+
+
+def test_loop() -> None:
+    g = UndirectedGraph()
+    node = g.add_node()
+    with pytest.raises(InvalidOperation):
+        g.add_edge(node, node)
+
+
+def test_edges() -> None:
+    g = UndirectedGraph()
+    a, b, c, d = (g.add_node(value) for value in 'ABCD')
+    g.add_edge(a, b)
+    g.add_edge(b, c)
+    g.add_edge(c, a)
+    g.add_edge(c, d)
+    with pytest.raises(InvalidOperation):
+        g.add_edge(b, a)
+    edges = [frozenset((tail.value, head.value)) for tail, head in g.edges()]
+    assert len(edges) == g.edge_count() == 4
+    assert set(edges) == {frozenset('AB'), frozenset('BC'), frozenset('AC'), frozenset('CD')}
+
+    g.remove_node(c)
+    assert set(a) == {b} and set(b) == {a} and set(d) == set()
+    assert g.edge_count() == 1
+    with pytest.raises(KeyError):
+        g.remove_node(c)
+    g.remove_edge(b, a)
+    assert list(g.edges()) == []
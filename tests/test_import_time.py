@@ -0,0 +1,93 @@
+# guards against library modules pulling in test or optional dependencies at import time
+from typing import Set, Tuple
+import os
+import statistics
+import subprocess
+import sys
+import pytest  # type: ignore
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+HEAVY = {'pytest', '_pytest', 'asyncio', 'multiprocessing', 'concurrent', 'tracemalloc', 'random'}
+
+LIGHT_MODULES = [
+    'algorithms', 'degree_index', 'igraph', 'graph', 'graph_reverse', 'graph_undirected',
+    'graph_functions', 'graph_generic', 'graph_cache', 'graph_multi', 'graph_sharded',
+    'ordered_set', 'reachability', 'subgraph_matching', 'triangles',
+    'dictgraph', 'dictgraph_interned', 'dictgraph_nodeclass', 'dictgraph_nodegeneric',
+    'dictgraph_reverse_nodegeneric', 'setgraph_nodeclass',
+]
+
+
+def import_in_subprocess(module: str) -> Tuple[Set[str], int]:
+    '''
+    Imports module in a fresh interpreter
+    Returns the top-level packages it loaded, and its cumulative import time in microseconds
+    '''
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    packages: Set[str] = set()
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        _, cumulative_str, name = line.split('|')
+        packages.add(name.strip().split('.')[0])
+        if name.strip() == module:
+            cumulative = int(cumulative_str)
+    return packages, cumulative
+
+
+@pytest.mark.parametrize('module', LIGHT_MODULES)
+def test_import_is_light(module):  # type: ignore
+    packages, _ = import_in_subprocess('typed_graphs.' + module)
+    assert not packages & HEAVY
+
+
+# wall-clock timings are too noisy for every run of the suite, so the budget
+# is only checked when this variable is set; a light module may take up to
+# BUDGET_FACTOR times as long to import as igraph (typing and the package itself),
+# plus some slack, comparing the median of several imports of each
+BUDGET_ENV = 'TYPED_GRAPHS_IMPORT_BUDGET'
+BUDGET_FACTOR = 3
+BUDGET_SLACK_US = 10000
+BUDGET_RUNS = 5
+
+
+def median_import_us(module: str) -> int:
+    return statistics.median(import_in_subprocess(module)[1] for _ in range(BUDGET_RUNS))
+
+
+@pytest.fixture(scope='module')
+def baseline_us() -> int:
+    return median_import_us('typed_graphs.igraph')
+
+
+@pytest.mark.skipif(not os.environ.get(BUDGET_ENV), reason='set {} to check'.format(BUDGET_ENV))
+@pytest.mark.parametrize('module', LIGHT_MODULES)
+def test_import_time_budget(module, baseline_us):  # type: ignore
+    cumulative = median_import_us('typed_graphs.' + module)
+    budget = BUDGET_FACTOR * baseline_us + BUDGET_SLACK_US
+    assert cumulative <= budget, 'importing {} took {}us, budget {}us'.format(
+        module, cumulative, budget)
+
+
+def test_package_import_is_lazy() -> None:
+    packages, _ = import_in_subprocess('typed_graphs')
+    assert not packages & HEAVY
+    env = dict(os.environ, PYTHONPATH=SRC)
+    code = ('import sys, typed_graphs; '
+            'assert not [m for m in sys.modules if m.startswith("typed_graphs.")]; '
+            'typed_graphs.graph_reverse.ReversibleGraph()')
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
+
+
+def test_algorithms_doesnt_import_representations() -> None:
+    # algorithms dispatches on node._adj and Mapping instead of importing these
+    env = dict(os.environ, PYTHONPATH=SRC)
+    code = ('import sys, typed_graphs.algorithms; '
+            'assert not {"typed_graphs.graph_multi", "typed_graphs.graph_sharded", '
+            '"typed_graphs.dictgraph_interned"} & set(sys.modules)')
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
@@ -0,0 +1,119 @@
+from io import StringIO
+import os
+import subprocess
+import sys
+import pytest  # type: ignore
+from typed_graphs.graph import Graph
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_undirected import UndirectedGraph
+from typed_graphs.graph_functions import read_graph, write_graph
+from typed_graphs.ordered_set import OrderedSet
+from generic import generic_tests
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+class OrderedGraph(Graph):
+    def __init__(self) -> None:
+        super().__init__(ordered=True)
+
+
+class OrderedReversibleGraph(ReversibleGraph):
+    def __init__(self) -> None:
+        super().__init__(ordered=True)
+
+
+class OrderedUndirectedGraph(UndirectedGraph):
+    def __init__(self) -> None:
+        super().__init__(ordered=True)
+
+
+ordered_classes = [OrderedGraph, OrderedReversibleGraph, OrderedUndirectedGraph]
+
+
+def test_ordered_set() -> None:
+    s = OrderedSet('cab')
+    s.add('d')
+    s.add('a')
+    assert list(s) == ['c', 'a', 'b', 'd']
+    s.remove('a')
+    with pytest.raises(KeyError):
+        s.remove('a')
+    s.discard('a')
+    s.update('ea')
+    assert list(s) == ['c', 'b', 'd', 'e', 'a'] and len(s) == 5 and 'e' in s
+    assert s == {'a', 'b', 'c', 'd', 'e'} and s != {'a'}
+    assert OrderedSet('ab') == OrderedSet('ba')
+    assert repr(OrderedSet()) == 'OrderedSet()'
+
+
+def test_ordered_set_is_a_set() -> None:
+    union = OrderedSet('ba') | {'c'}
+    assert isinstance(union, OrderedSet) and list(union) == ['b', 'a', 'c']
+    assert {'c'} | OrderedSet('a') == {'a', 'c'}
+    # intersections keep the order of the OrderedSet, whichever side it's on
+    assert list(OrderedSet('abc') & {'c', 'a'}) == ['a', 'c']
+    assert list({'c', 'a'} & OrderedSet('abc')) == ['a', 'c']
+    assert list(OrderedSet('abc') - {'b'}) == ['a', 'c']
+    assert OrderedSet('ab') <= {'a', 'b', 'c'} and OrderedSet('ab').isdisjoint('cd')
+    # not a dict
+    assert OrderedSet() != {} and OrderedSet('a') != {'a': None}
+    with pytest.raises(TypeError):
+        OrderedSet()['a']  # type: ignore
+    with pytest.raises(TypeError):
+        hash(OrderedSet())
+
+    s = OrderedSet('abc')
+    assert s.pop() == 'c' and list(s) == ['a', 'b']
+    copy = s.copy()
+    s.clear()
+    assert list(copy) == ['a', 'b'] and not s
+    with pytest.raises(KeyError):
+        s.pop()
+
+
+@pytest.mark.parametrize('cls', ordered_classes)
+@pytest.mark.parametrize('test_func', generic_tests)
+def test_ordered_graph(test_func, cls):  # type: ignore
+    test_func(cls)
+
+
+def build(cls):  # type: ignore
+    g = cls()
+    nodes = [g.add_node(value) for value in 'abcdefgh']
+    for i, tail in enumerate(nodes):
+        g.add_edges(tail, [nodes[(i * 3 + 1) % 8], nodes[(i * 5 + 2) % 8], nodes[(i + 7) % 8]])
+    g.remove_edge(nodes[0], nodes[7])
+    g.remove_node(nodes[3])
+    g.add_edge(nodes[0], nodes[7])
+    return g
+
+
+@pytest.mark.parametrize('cls', ordered_classes)
+def test_write_graph_is_deterministic(cls):  # type: ignore
+    output = write_graph(build(cls))
+    assert output == write_graph(build(cls))
+    assert output.splitlines()[0].split()[:2] == ['0', 'a']
+    # reading the same text gives the same build sequence
+    reread = write_graph(read_graph(cls, StringIO(output), str))
+    assert reread == write_graph(read_graph(cls, StringIO(output), str))
+
+
+def test_write_graph_is_deterministic_across_runs() -> None:
+    script = '\n'.join([
+        'from typed_graphs.graph import Graph',
+        'from typed_graphs.graph_functions import write_graph',
+        'g = Graph(ordered=True)',
+        'nodes = [g.add_node(str(i)) for i in range(100)]',
+        'for i in range(1000):',
+        '    g.add_edges(nodes[i * 7 % 100], [nodes[i * 13 % 97]])',
+        'g.remove_node(nodes[50])',
+        'print(write_graph(g))',
+    ])
+    outputs = []
+    for seed in ['1', '2']:
+        env = dict(os.environ, PYTHONPATH=SRC, PYTHONHASHSEED=seed)
+        result = subprocess.run([sys.executable, '-c', script], env=env,
+                                stdout=subprocess.PIPE, universal_newlines=True, check=True)
+        outputs.append(result.stdout)
+    assert outputs[0] == outputs[1]
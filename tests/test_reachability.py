@@ -0,0 +1,105 @@
+from typing import List, Set, Tuple
+import random
+import pytest  # type: ignore
+from typed_graphs.graph import Graph, Node
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.reachability import (
+    ReachabilityIndex, SparseReachabilityIndex, strongly_connected_components
+)
+
+
+def reachable(source: Node) -> Set[Node]:
+    seen = {source}
+    stack = [source]
+    while stack:
+        for neighbor in stack.pop():
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def get_random_graph(n: int, m: int, seed: int) -> Tuple[ReversibleGraph, List[Node]]:
+    rng = random.Random(seed)
+    g = ReversibleGraph()
+    nodes = [g.add_node(i) for i in range(n)]
+    for _ in range(m):
+        tail, head = rng.choice(nodes), rng.choice(nodes)
+        if head not in tail:
+            g.add_edge(tail, head)
+    return g, nodes
+
+
+def assert_index_correct(index: ReachabilityIndex, nodes: List[Node]) -> None:
+    for tail in nodes:
+        expected = reachable(tail)
+        for head in nodes:
+            assert index.reaches(tail, head) == (head in expected)
+
+
+def test_strongly_connected_components() -> None:
+    g = ReversibleGraph()
+    a, b, c, d = (g.add_node(value) for value in 'ABCD')
+    g.add_edge(a, b)
+    g.add_edge(b, a)
+    g.add_edge(b, c)
+    g.add_edge(c, c)
+    components = strongly_connected_components(g)
+    assert sorted(sorted(n.value for n in comp) for comp in components) == [
+        ['A', 'B'], ['C'], ['D']]
+    order = {node: i for i, comp in enumerate(components) for node in comp}
+    assert order[c] < order[a]
+
+
+index_classes = [ReachabilityIndex, SparseReachabilityIndex]
+
+
+@pytest.mark.parametrize('cls', index_classes)
+@pytest.mark.parametrize('seed', range(5))
+def test_reachability_index(seed, cls):  # type: ignore
+    g, nodes = get_random_graph(30, 40, seed)
+    index = cls(g)
+    assert_index_correct(index, nodes)
+
+    rng = random.Random(seed)
+    for _ in range(10):
+        tail, head = rng.choice(nodes), rng.choice(nodes)
+        if head not in tail:
+            index.add_edge(tail, head)
+            assert not index.stale
+    nodes.append(index.add_node('new'))
+    index.add_edge(nodes[-1], nodes[0])
+    assert not index.stale
+    assert_index_correct(index, nodes)
+
+    tail = next(node for node in nodes if len(node))
+    index.remove_edge(tail, next(iter(tail)))
+    assert index.stale
+    assert_index_correct(index, nodes)
+    index.remove_node(nodes.pop(0))
+    assert_index_correct(index, nodes)
+
+    # mutations that bypass the index are detected too
+    g.add_edge(nodes[-1], nodes[1])
+    assert index.stale
+    assert_index_correct(index, nodes)
+    assert index.memory_usage() > 0
+
+
+@pytest.mark.parametrize('cls', index_classes)
+def test_long_path(cls):  # type: ignore
+    g = Graph()
+    nodes = [g.add_node(i) for i in range(5000)]
+    for tail, head in zip(nodes, nodes[1:]):
+        g.add_edge(tail, head)
+    index = cls(g)
+    assert index.reaches(nodes[0], nodes[-1])
+    assert not index.reaches(nodes[-1], nodes[0])
+
+
+def test_sparse_index_memory() -> None:
+    # with no edges, each bitset still spans the components numbered before it
+    g = Graph()
+    for i in range(5000):
+        g.add_node(i)
+    assert SparseReachabilityIndex(g).memory_usage() < ReachabilityIndex(g).memory_usage()
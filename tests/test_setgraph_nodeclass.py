@@ -0,0 +1,56 @@
+import pytest  # type: ignore
+from typed_graphs.setgraph_nodeclass import (
+    Graph, Node, labeled_graph_eq, read_graph, write_graph
+)
+
+
+def get_test_graph() -> Graph[str]:
+    a = Node('A')
+    b = Node('B')
+    c = Node('C')
+    d = Node('D')
+    a._adj = {a, b, c}
+    c._adj = {b}
+    return {a, b, c, d}
+
+
+def test_basic_functionality() -> None:
+    g = get_test_graph()
+    assert {str(node) for node in g} == {'<Node A>', '<Node B>', '<Node C>', '<Node D>'}
+
+
+def test_labeled_eq() -> None:
+    g1 = get_test_graph()
+    g2 = get_test_graph()
+    assert labeled_graph_eq(g1, g2)
+
+    nodes = list(g1)
+    nodes[0].value, nodes[1].value = nodes[1].value, nodes[0].value
+    assert not labeled_graph_eq(g1, g2)
+
+    g1 = get_test_graph()
+    nodes = list(g1)
+    nodes[0].value = 'Z'
+    assert not labeled_graph_eq(g1, g2)
+
+    for node in g1:
+        node.value = 'Z'
+    for node in g2:
+        node.value = 'Z'
+    with pytest.raises(NotImplementedError):
+        labeled_graph_eq(g1, g2)
+
+    g1.remove(nodes[0])
+    assert not labeled_graph_eq(g1, g2)
+
+
+def test_serialization() -> None:
+    g = get_test_graph()
+
+    g_str = '''0 A 0 1 2
+    1 B
+    2 C 1
+    3 D'''
+
+    assert labeled_graph_eq(read_graph(g_str, str), g)
+    assert labeled_graph_eq(read_graph(write_graph(g), str), g)
@@ -0,0 +1,94 @@
+from typing import Any, List, Set, Tuple
+from itertools import permutations
+import random
+import pytest  # type: ignore
+from typed_graphs.graph import Graph
+from typed_graphs.graph_reverse import ReversibleGraph
+from typed_graphs.graph_undirected import UndirectedGraph
+from typed_graphs.subgraph_matching import SubgraphMatcher, find_matches
+
+
+def make_graph(cls: Any, values: List[Any], edges: List[Tuple[int, int]]) -> Any:
+    g = cls()
+    nodes = [g.add_node(value) for value in values]
+    for tail, head in edges:
+        g.add_edges(nodes[tail], [nodes[head]])
+    return g
+
+
+def brute_force(pattern: Any, target: Any, induced: bool) -> Set[Tuple[Any, ...]]:
+    # every injective, value-preserving assignment that maps edges (self-loops included) to edges
+    pattern_nodes = list(pattern)
+    result = set()
+    for images in permutations(list(target), len(pattern_nodes)):
+        match = dict(zip(pattern_nodes, images))
+        if any(p.value != t.value for p, t in match.items()):
+            continue
+        edges_agree = [(match[b] in match[a]) == (b in a) if induced else
+                       (b not in a or match[b] in match[a])
+                       for a in pattern_nodes for b in pattern_nodes]
+        if all(edges_agree):
+            result.add(images)
+    return result
+
+
+@pytest.mark.parametrize('cls', [Graph, ReversibleGraph, UndirectedGraph])
+@pytest.mark.parametrize('induced', [False, True])
+def test_matches_agree_with_brute_force(cls, induced):  # type: ignore
+    rng = random.Random(1)
+    for _ in range(10):
+        target = make_graph(cls, [rng.randrange(2) for _ in range(8)],
+                            [(rng.randrange(8), rng.randrange(8)) for _ in range(16)])
+        pattern_edges = [(0, 1), (1, 2)] + [(2, 0)] * rng.randrange(2)
+        pattern_edges += [(1, 1)] * rng.randrange(2)
+        pattern = make_graph(cls, [rng.randrange(2) for _ in range(3)], pattern_edges)
+        expected = brute_force(pattern, target, induced)
+        pattern_nodes = list(pattern)
+        found = [tuple(match[p] for p in pattern_nodes)
+                 for match in find_matches(pattern, target, induced=induced)]
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+
+
+def test_directed_triangle() -> None:
+    target = make_graph(Graph, 'abcd', [(0, 1), (1, 2), (2, 0), (2, 3)])
+    pattern = make_graph(Graph, 'abc', [(0, 1), (1, 2), (2, 0)])
+    matches = list(find_matches(pattern, target))
+    assert len(matches) == 1
+    assert {p.value: t.value for p, t in matches[0].items()} == {'a': 'a', 'b': 'b', 'c': 'c'}
+    # the reverse cycle is not there
+    reverse = make_graph(Graph, 'abc', [(1, 0), (2, 1), (0, 2)])
+    assert list(find_matches(reverse, target)) == []
+    # without values, the three rotations match
+    assert len(list(find_matches(pattern, target, match_values=False))) == 3
+
+
+def test_self_loops() -> None:
+    # a pattern self-loop needs a target self-loop
+    target = make_graph(Graph, 'xxx', [(0, 1), (0, 2), (2, 0)])
+    pattern = make_graph(Graph, 'xx', [(0, 0), (0, 1)])
+    assert list(find_matches(pattern, target)) == []
+    # an induced match can't map onto a target self-loop the pattern doesn't have
+    target = make_graph(Graph, 'uv', [(0, 0), (0, 1)])
+    pattern = make_graph(Graph, 'xy', [(0, 1)])
+    assert len(list(find_matches(pattern, target, match_values=False))) == 1
+    assert list(find_matches(pattern, target, induced=True, match_values=False)) == []
+
+
+def test_undirected_fan_out() -> None:
+    target = make_graph(UndirectedGraph, [0, 1, 1, 1, 1], [(0, 1), (0, 2), (0, 3), (4, 0)])
+    pattern = make_graph(UndirectedGraph, [0, 1, 1], [(1, 0), (0, 2)])
+    assert len(list(find_matches(pattern, target))) == 4 * 3
+
+
+def test_limit_and_timeout() -> None:
+    target = make_graph(Graph, [0] * 30, [(i, j) for i in range(30) for j in range(30) if i != j])
+    pattern = make_graph(Graph, [0] * 6, [(i, i + 1) for i in range(5)])
+    assert len(list(find_matches(pattern, target, limit=5))) == 5
+
+    matcher = SubgraphMatcher(pattern, target)
+    matches = matcher.matches()
+    next(matches)  # lazily generated, the first match doesn't enumerate the rest
+    assert not matcher.timed_out
+    list(matcher.matches(timeout=0.05))
+    assert matcher.timed_out
@@ -0,0 +1,58 @@
+import pytest  # type: ignore
+from typed_graphs.graph import Graph
+from typed_graphs.graph_undirected import UndirectedGraph
+from typed_graphs.triangles import (
+    approximate_triangle_count, average_clustering, clustering, get_random_graph,
+    local_triangle_counts, naive_triangle_count, transitivity, triangle_count, wedge_count
+)
+
+
+def test_small_graph() -> None:
+    # K4 plus a pendant node
+    g = UndirectedGraph()
+    a, b, c, d, e = [g.add_node(value) for value in 'abcde']
+    g.add_edges(a, [b, c, d, e])
+    g.add_edges(b, [c, d])
+    g.add_edge(c, d)
+    assert triangle_count(g) == 4
+    assert local_triangle_counts(g) == {a: 3, b: 3, c: 3, d: 3, e: 0}
+    coefficients = clustering(g)
+    assert coefficients[a] == pytest.approx(0.5)
+    assert coefficients[b] == coefficients[c] == coefficients[d] == 1.0
+    assert coefficients[e] == 0.0
+    assert average_clustering(g) == pytest.approx(3.5 / 5)
+    assert wedge_count(g) == 6 + 3 * 3
+    assert transitivity(g) == pytest.approx(12 / 15)
+    assert triangle_count(UndirectedGraph()) == 0
+
+
+def test_agrees_with_naive() -> None:
+    g = get_random_graph(2000, 5)
+    expected = naive_triangle_count(g)
+    assert triangle_count(g) == expected
+    local = local_triangle_counts(g)
+    assert sum(local.values()) == 3 * expected
+    node = max(g, key=len)
+    neighbors = list(node)
+    assert local[node] == sum(b in a for i, a in enumerate(neighbors) for b in neighbors[i + 1:])
+
+
+def test_parallel() -> None:
+    g = get_random_graph(2000, 5)
+    assert triangle_count(g, workers=2) == triangle_count(g)
+    assert local_triangle_counts(g, workers=2) == local_triangle_counts(g)
+
+
+def test_approximate() -> None:
+    g = get_random_graph(2000, 5)
+    exact = triangle_count(g)
+    estimate = approximate_triangle_count(g, samples=20000, seed=0)
+    assert abs(estimate.triangles - exact) <= estimate.triangles_error
+    assert abs(estimate.transitivity - transitivity(g)) <= estimate.transitivity_error
+    with pytest.raises(ValueError):
+        approximate_triangle_count(g, samples=0)
+
+
+def test_directed_graph_rejected() -> None:
+    with pytest.raises(TypeError):
+        triangle_count(Graph())  # type: ignore